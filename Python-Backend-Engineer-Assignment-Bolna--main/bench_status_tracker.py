@@ -0,0 +1,389 @@
+"""
+Benchmarks for the Status Page Tracker hot paths.
+
+Measures, over synthetic Atom feeds of varying size (with and without HTML
+content):
+  - strip_html and parse_incident throughput (entries/sec)
+  - _process_entries on the initial run and on a steady-state diff where
+    only one entry changed
+  - parse + change scan of a whole body with each parser engine
+    (feedparser vs. the lean stdlib Atom engine)
+  - a whole fetch cycle (HTTP 200 + parse + diff) against a local aiohttp
+    server, reported as latency percentiles
+
+Peak memory (tracemalloc) is reported per case.  Results can be saved as a
+baseline and later runs compared against it; a throughput drop or latency
+rise beyond the tolerance is reported as a regression (exit code 1).
+
+Usage:
+  python bench_status_tracker.py                         # full suite
+  python bench_status_tracker.py --quick                 # 10..1000 entries
+  python bench_status_tracker.py --save-baseline bench_baseline.json
+  python bench_status_tracker.py --baseline bench_baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from html import escape
+
+import feedparser
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from status_tracker import (
+    PARSER_ENGINES,
+    StatusPageMonitor,
+    _entry_id,
+    _entry_key,
+    create_session,
+    parse_feed_body,
+    parse_incident,
+    strip_html,
+)
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+QUICK_SIZES = (10, 100, 1000)
+DEFAULT_TOLERANCE = 0.20  # 20% slower than baseline counts as a regression
+
+
+# ---------------------------------------------------------------------------
+# Synthetic feeds
+# ---------------------------------------------------------------------------
+def make_feed(n: int, html: bool = True, bump: int | None = None) -> bytes:
+    """
+    Build an Atom feed with ``n`` entries, newest first.
+
+    ``bump`` edits that entry's message and moves its updated timestamp
+    forward, which is how a steady-state "one incident changed" cycle is
+    simulated (change detection compares content, not just timestamps).
+    """
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<feed xmlns="http://www.w3.org/2005/Atom"><title>Bench</title>',
+    ]
+    base = 1_700_000_000
+    for i in range(n):
+        ts = base - i * 3600 + (7200 if i == bump else 0)
+        updated = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+        note = " A postmortem has been published." if i == bump else ""
+        if html:
+            body = (
+                f"<p><strong>Resolved</strong> - Incident {i} has been resolved."
+                f"{note}</p>"
+                f"<p>We saw elevated error rates on the API.</p>"
+                f"<ul><li>Chat Completions (Degraded Performance)</li>"
+                f"<li>Login (Operational)</li></ul>"
+            )
+            content = f'<content type="html">{escape(body)}</content>'
+        else:
+            content = f"<summary>Incident {i} has been resolved.{note}</summary>"
+        parts.append(
+            f"<entry><id>tag:bench,2025:incident/{i}</id>"
+            f"<title>Incident {i}</title>"
+            f'<link rel="alternate" href="https://status.example.com/incidents/{i}"/>'
+            f"<updated>{updated}</updated>{content}</entry>"
+        )
+    parts.append("</feed>")
+    return "\n".join(parts).encode()
+
+
+# ---------------------------------------------------------------------------
+# Measurement helpers
+# ---------------------------------------------------------------------------
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    return {
+        "p50_ms": pct(0.50) * 1000,
+        "p95_ms": pct(0.95) * 1000,
+        "p99_ms": pct(0.99) * 1000,
+    }
+
+
+def _measure(fn, entries: int, repeats: int) -> dict[str, float]:
+    """Time ``fn`` ``repeats`` times; report throughput, latency, memory."""
+    fn()  # warm-up
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {"entries_per_sec": entries / statistics.mean(samples)}
+    result.update(_percentiles(samples))
+    result["peak_kib"] = peak / 1024
+    return result
+
+
+def _quiet_monitor(**kwargs) -> StatusPageMonitor:
+    return StatusPageMonitor(
+        name="Bench",
+        feed_url="http://bench.invalid/history.atom",
+        callback=lambda n, i: None,
+        **kwargs,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+def bench_parsing(n: int, html: bool, repeats: int) -> dict[str, dict]:
+    entries = feedparser.parse(make_feed(n, html)).entries
+    raws = [
+        e.content[0]["value"] if e.get("content") else e.get("summary", "")
+        for e in entries
+    ]
+
+    def do_strip():
+        for raw in raws:
+            strip_html(raw)
+
+    def do_parse():
+        for entry in entries:
+            parse_incident(entry)
+
+    def do_initial():
+        _quiet_monitor()._process_entries(entries, initial=True)
+
+    monitor = _quiet_monitor()
+    monitor._process_entries(entries, initial=True)
+    changed = feedparser.parse(make_feed(n, html, bump=n // 2)).entries
+    steady = [entries, changed]
+
+    def do_diff():
+        # Alternate between two versions so every call sees one change
+        steady.reverse()
+        monitor._process_entries(steady[0], initial=False)
+
+    return {
+        "strip_html": _measure(do_strip, n, repeats),
+        "parse_incident": _measure(do_parse, n, repeats),
+        "process_initial": _measure(do_initial, n, repeats),
+        "process_diff": _measure(do_diff, n, repeats),
+    }
+
+
+def bench_engines(n: int, html: bool, repeats: int) -> dict[str, dict]:
+    """parse_feed_body on an initial run (every entry converted) per engine."""
+    body = make_feed(n, html)
+    return {
+        f"engine_{name}": _measure(
+            lambda source=source: parse_feed_body(body, {}, True, source),
+            n,
+            repeats,
+        )
+        for name, source in PARSER_ENGINES.items()
+    }
+
+
+def bench_cycle(n: int, html: bool, repeats: int) -> dict[str, dict]:
+    """Whole fetch cycles against a local server; one entry changes per cycle."""
+    bodies = [make_feed(n, html), make_feed(n, html, bump=n // 2)]
+    counter = 0
+
+    async def handler(request):
+        nonlocal counter
+        counter += 1
+        return web.Response(
+            body=bodies[counter % 2], content_type="application/atom+xml"
+        )
+
+    async def scenario(repeats: int) -> list[float]:
+        app = web.Application()
+        app.router.add_get("/history.atom", handler)
+        async with TestServer(app) as server, create_session() as session:
+            monitor = StatusPageMonitor(
+                name="Bench",
+                feed_url=str(server.make_url("/history.atom")),
+                callback=lambda n, i: None,
+            )
+            await monitor.poll(session)  # initial + warm-up
+            samples = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                await monitor.poll(session)
+                samples.append(time.perf_counter() - start)
+            return samples
+
+    # Time without tracing, then take peak memory from a separate pass
+    samples = asyncio.run(scenario(repeats))
+    tracemalloc.start()
+    asyncio.run(scenario(1))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {"entries_per_sec": n / statistics.mean(samples)}
+    result.update(_percentiles(samples))
+    result["peak_kib"] = peak / 1024
+    return {"cycle": result}
+
+
+def bench_seen_state(feeds: int = 1000, entries: int = 50) -> dict[str, float]:
+    """
+    Memory held by change-detection state for a whole fleet.
+
+    Compares the integer fingerprints the monitor stores against the
+    isoformat timestamp strings it used to store, for identical incident IDs.
+    """
+    parsed = feedparser.parse(make_feed(entries, html=False)).entries
+    monitors = [_quiet_monitor() for _ in range(feeds)]
+
+    for monitor in monitors:
+        monitor._process_entries(parsed, initial=True)
+    int_state = [m._seen_incidents for m in monitors]
+    int_bytes = sum(
+        sys.getsizeof(seen) + sum(sys.getsizeof(v) for v in seen.values())
+        for seen in int_state
+    )
+    iso_state = [
+        {
+            _entry_id(e): datetime.fromtimestamp(
+                _entry_key(e), tz=timezone.utc
+            ).isoformat()
+            for e in parsed
+        }
+        for _ in monitors
+    ]
+    iso_bytes = sum(
+        sys.getsizeof(seen) + sum(sys.getsizeof(v) for v in seen.values())
+        for seen in iso_state
+    )
+
+    return {
+        "feeds": feeds,
+        "entries_per_feed": entries,
+        "int_keys_kib": int_bytes / 1024,
+        "iso_keys_kib": iso_bytes / 1024,
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES, repeats: int = 10) -> dict[str, dict]:
+    """Run every case; keys look like ``parse_incident/1000/html``."""
+    results: dict[str, dict] = {}
+    for n in sizes:
+        # Keep large feeds from dominating the wall-clock time
+        reps = max(3, repeats * 100 // max(n, 100))
+        for html in (True, False):
+            variant = "html" if html else "plain"
+            for case, stats in {
+                **bench_parsing(n, html, reps),
+                **bench_engines(n, html, reps),
+                **bench_cycle(n, html, reps),
+            }.items():
+                results[f"{case}/{n}/{variant}"] = stats
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """Return a description of every case that regressed beyond tolerance."""
+    regressions = []
+    for key, stats in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if stats["entries_per_sec"] < base["entries_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{key}: {stats['entries_per_sec']:.0f} entries/s "
+                f"(baseline {base['entries_per_sec']:.0f})"
+            )
+        if stats["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{key}: p95 {stats['p95_ms']:.2f}ms "
+                f"(baseline {base['p95_ms']:.2f}ms)"
+            )
+    return regressions
+
+
+def print_table(results: dict[str, dict]) -> None:
+    print(
+        f"{'case':<34}{'entries/s':>14}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'peak KiB':>11}"
+    )
+    for key, r in results.items():
+        print(
+            f"{key:<34}{r['entries_per_sec']:>14,.0f}{r['p50_ms']:>10.2f}"
+            f"{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['peak_kib']:>11,.0f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true", help="skip 10k feeds")
+    parser.add_argument("--sizes", type=int, nargs="+", help="feed sizes")
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--save-baseline", help="write results to this file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument(
+        "--fleet-memory",
+        type=int,
+        metavar="FEEDS",
+        help="only report seen-state memory for a fleet of FEEDS x 50 entries",
+    )
+    args = parser.parse_args(argv)
+
+    # The tracker logs every NEW/UPDATED incident, the server every request
+    logging.getLogger("status_tracker").setLevel(logging.WARNING)
+    logging.getLogger("aiohttp.access").setLevel(logging.WARNING)
+
+    if args.fleet_memory:
+        mem = bench_seen_state(args.fleet_memory)
+        print(
+            f"Seen state for {mem['feeds']} feeds x {mem['entries_per_feed']} "
+            f"entries: {mem['int_keys_kib']:,.0f} KiB with fingerprint ints, "
+            f"{mem['iso_keys_kib']:,.0f} KiB with isoformat strings"
+        )
+        return 0
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    results = run_suite(sizes, args.repeats)
+    print_table(results)
+
+    print()
+    for key, stats in results.items():
+        if key.startswith("engine_lean/"):
+            base = results[key.replace("engine_lean/", "engine_feedparser/")]
+            speedup = stats["entries_per_sec"] / base["entries_per_sec"]
+            print(f"lean engine speedup {key.split('/', 1)[1]:<14}{speedup:>6.1f}x")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
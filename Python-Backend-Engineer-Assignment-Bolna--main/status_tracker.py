@@ -19,16 +19,38 @@ Usage:
   python status_tracker.py
 """
 
+import argparse
 import asyncio
+import bisect
+import concurrent.futures
+import contextlib
+import hashlib
+import heapq
+import inspect
+import itertools
+import json
 import logging
+import multiprocessing
+import os
+import queue
+import random
 import signal
+import sqlite3
 import sys
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from calendar import timegm
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from html.parser import HTMLParser
-from typing import Callable
+from collections import OrderedDict
+from typing import Awaitable, Callable
+from urllib.parse import urljoin, urlsplit
 
 import aiohttp
 import feedparser
+from aiohttp import web
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -41,6 +63,327 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class _Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{_escape_label(str(v))}"' for k, v in labels)
+    return "{" + inner + "}"
+
+
+class MetricsRegistry:
+    """
+    In-process counters, histograms and gauges.
+
+    Recording is a dict lookup plus an add, so the hot path pays almost
+    nothing; the text exposition is only built when /metrics is scraped.
+    Gauges are callables evaluated at scrape time.
+    """
+
+    def __init__(self):
+        self._counters: dict[str, dict[tuple, float]] = {}
+        self._histograms: dict[str, dict[tuple, _Histogram]] = {}
+        self._gauges: dict[str, Callable[[], float]] = {}
+        self._help: dict[str, str] = {}
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        series = self._counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        series = self._histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        hist = series.get(key)
+        if hist is None:
+            hist = series[key] = _Histogram(LATENCY_BUCKETS)
+        hist.observe(value)
+
+    def gauge(self, name: str, fn: Callable[[], float]) -> None:
+        """Register (or replace) a gauge computed at scrape time."""
+        self._gauges[name] = fn
+
+    def remove_gauge(self, name: str) -> None:
+        self._gauges.pop(name, None)
+
+    def value(self, name: str, **labels: str) -> float:
+        """Current value of a counter series (0 if never incremented)."""
+        key = tuple(sorted(labels.items()))
+        return self._counters.get(name, {}).get(key, 0)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+
+        def header(name: str, kind: str) -> None:
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for name, series in sorted(self._counters.items()):
+            header(name, "counter")
+            for labels, value in series.items():
+                lines.append(f"{name}{_format_labels(labels)} {value:g}")
+
+        for name, series in sorted(self._histograms.items()):
+            header(name, "histogram")
+            for labels, hist in series.items():
+                cumulative = 0
+                bounds = [f"{b:g}" for b in hist.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, hist.counts):
+                    cumulative += count
+                    le = _format_labels(labels + (("le", bound),))
+                    lines.append(f"{name}_bucket{le} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {hist.sum:g}")
+                lines.append(f"{name}_count{_format_labels(labels)} {hist.count}")
+
+        for name, fn in sorted(self._gauges.items()):
+            header(name, "gauge")
+            try:
+                lines.append(f"{name} {fn():g}")
+            except Exception:
+                logger.exception("Gauge %s failed.", name)
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+for _name, _help in (
+    ("status_tracker_requests_total", "Feed fetches attempted."),
+    ("status_tracker_responses_total", "Feed responses by HTTP status."),
+    ("status_tracker_errors_total", "Network errors and malformed feeds."),
+    ("status_tracker_retries_total", "Fetch retries after transient failures."),
+    ("status_tracker_circuit_open_total", "Fetches skipped by an open circuit."),
+    ("status_tracker_response_bytes_total", "Response body bytes on the wire."),
+    ("status_tracker_decoded_bytes_total", "Response body bytes after decoding."),
+    ("status_tracker_body_unchanged_total", "Repeated bodies not re-parsed."),
+    ("status_tracker_cache_fresh_total", "Polls skipped while still fresh."),
+    ("status_tracker_fetch_seconds", "Request start to body received."),
+    ("status_tracker_parse_seconds", "Feed parse and change scan."),
+    ("status_tracker_process_seconds", "Diff against seen state and dispatch."),
+    ("status_tracker_callback_seconds", "Time spent inside incident callbacks."),
+    ("status_tracker_event_loop_lag_seconds", "Event-loop wake-up delay."),
+):
+    metrics.describe(_name, _help)
+
+
+async def start_metrics_server(
+    host: str = "127.0.0.1",
+    port: int = 9108,
+    registry: MetricsRegistry | None = None,
+) -> web.AppRunner:
+    """Serve ``registry`` (default: the module registry) at /metrics."""
+    registry = registry or metrics
+
+    async def handle(request: web.Request) -> web.Response:
+        return web.Response(
+            text=registry.render(),
+            content_type="text/plain",
+            headers={"X-Content-Type-Options": "nosniff"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info("Metrics available at http://%s:%d/metrics", host, port)
+    return runner
+
+
+# ---------------------------------------------------------------------------
+# HTTP connection pool
+# ---------------------------------------------------------------------------
+MAX_CONNECTIONS = 100  # total sockets across all feeds
+MAX_CONNECTIONS_PER_HOST = 8  # many feeds share statuspage/incident.io hosts
+DNS_CACHE_TTL = 300  # seconds
+KEEPALIVE_TIMEOUT = 75  # seconds; longer than the default poll interval
+
+
+def create_session(
+    limit: int = MAX_CONNECTIONS,
+    limit_per_host: int = MAX_CONNECTIONS_PER_HOST,
+    ttl_dns_cache: int = DNS_CACHE_TTL,
+    keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+) -> aiohttp.ClientSession:
+    """
+    Create a ClientSession tuned for polling many feeds.
+
+    A single session is meant to be shared by every monitor so that DNS
+    lookups, TLS handshakes and keep-alive connections are reused across
+    feeds served from the same host.  Bodies are not decompressed by
+    aiohttp; monitors decode them as they stream (see BodyDecoder) so both
+    wire and decoded sizes can be counted.  Must be called inside a
+    running loop.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=ttl_dns_cache,
+        keepalive_timeout=keepalive_timeout,
+    )
+    return aiohttp.ClientSession(connector=connector, auto_decompress=False)
+
+
+class _Http2Body:
+    """The slice of aiohttp's StreamReader the monitor uses."""
+
+    __slots__ = ("_resp",)
+
+    def __init__(self, resp):
+        self._resp = resp
+
+    async def iter_chunked(self, n: int):
+        async for chunk in self._resp.aiter_raw(n):
+            yield chunk
+
+
+class _Http2Response:
+    """httpx response exposed with aiohttp's ClientResponse interface."""
+
+    __slots__ = ("_resp", "status", "headers", "content")
+
+    def __init__(self, resp):
+        self._resp = resp
+        self.status = resp.status_code
+        self.headers = resp.headers  # case-insensitive, like CIMultiDict
+        self.content = _Http2Body(resp)
+
+    @property
+    def http_version(self) -> str:
+        return self._resp.http_version
+
+    @property
+    def url(self):
+        return self._resp.url
+
+    @property
+    def history(self) -> list["_Http2Response"]:
+        return [_Http2Response(r) for r in self._resp.history]
+
+    async def read(self) -> bytes:
+        return await self._resp.aread()
+
+
+class Http2Session:
+    """
+    HTTP/2 transport with the subset of the ClientSession API monitors use.
+
+    Backed by an ``httpx.AsyncClient`` (needs ``httpx[http2]``).  Requests
+    to the same origin are multiplexed as streams over one connection, so a
+    fleet of feeds on a shared status-hosting CDN costs one TLS handshake
+    and one socket per host instead of one per concurrent poll.  Request
+    errors (transport failures, redirect loops) are re-raised as aiohttp
+    exceptions so the monitor's retry and circuit-breaker handling is
+    unchanged.
+    """
+
+    auto_decompress = False  # content yields raw bytes, as with create_session
+
+    def __init__(
+        self,
+        limit: int = MAX_CONNECTIONS,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+        prior_knowledge: bool = False,
+    ):
+        """
+        ``prior_knowledge`` speaks HTTP/2 without negotiation, which is the
+        only way to get it over plain http:// (h2c); otherwise HTTP/2 is
+        negotiated via TLS ALPN and servers without it get HTTP/1.1.
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise RuntimeError("HTTP/2 transport requires httpx[http2]") from None
+        self._httpx = httpx
+        self._client = httpx.AsyncClient(
+            http1=not prior_knowledge,
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=limit, keepalive_expiry=keepalive_timeout
+            ),
+            timeout=30.0,
+        )
+
+    @contextlib.asynccontextmanager
+    async def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+    ):
+        httpx = self._httpx
+        request = self._client.build_request(
+            "GET",
+            url,
+            headers=headers,
+            timeout=timeout.total if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+        try:
+            resp = await self._client.send(request, stream=True)
+        except httpx.TimeoutException:
+            raise asyncio.TimeoutError() from None
+        except httpx.TransportError as exc:
+            raise aiohttp.ClientConnectionError(str(exc)) from exc
+        except httpx.RequestError as exc:  # e.g. TooManyRedirects
+            raise aiohttp.ClientError(str(exc)) from exc
+        try:
+            yield _Http2Response(resp)
+        except httpx.TimeoutException:
+            raise asyncio.TimeoutError() from None
+        except httpx.RequestError as exc:
+            raise aiohttp.ClientPayloadError(str(exc)) from exc
+        finally:
+            await resp.aclose()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "Http2Session":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def open_session(http2: bool = False):
+    """Pooled aiohttp session, or an Http2Session when ``http2`` is set."""
+    return Http2Session() if http2 else create_session()
+
+
 # ---------------------------------------------------------------------------
 # Utility – strip HTML tags from feed content
 # ---------------------------------------------------------------------------
@@ -99,6 +442,18 @@ class IncidentUpdate:
         self.latest_message = latest_message
         self.updated_at = updated_at
 
+    def update_from(self, other: "IncidentUpdate") -> None:
+        """Copy every field of ``other`` onto this object in place."""
+        for field in self.__slots__:
+            setattr(self, field, getattr(other, field))
+        self.affected_components = list(other.affected_components)
+
+    def copy(self) -> "IncidentUpdate":
+        """An independent copy (the component list is not shared)."""
+        clone = IncidentUpdate.__new__(IncidentUpdate)
+        clone.update_from(self)
+        return clone
+
     def __repr__(self) -> str:
         return f"IncidentUpdate(id={self.id!r}, title={self.title!r})"
 
@@ -106,7 +461,36 @@ class IncidentUpdate:
 # ---------------------------------------------------------------------------
 # Feed parser helpers
 # ---------------------------------------------------------------------------
-def _parse_components(entry) -> list[str]:
+class _EntryBody:
+    """
+    Plain-text view of an entry's content, decoded once per entry.
+
+    The status, component and message extractors all work from the same
+    stripped text, so the HTML parser runs at most once per entry.
+    """
+
+    __slots__ = ("text", "lines")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lines = text.split("\n")
+
+
+def _entry_raw_content(entry) -> str:
+    """Return the raw (HTML) content or summary of an entry."""
+    if hasattr(entry, "content") and entry.content:
+        return entry.content[0].get("value", "")
+    if hasattr(entry, "summary"):
+        return entry.summary or ""
+    return ""
+
+
+def _entry_body(entry) -> _EntryBody:
+    """Strip the entry content once and return the shared intermediate."""
+    return _EntryBody(strip_html(_entry_raw_content(entry)))
+
+
+def _parse_components(entry, body: _EntryBody | None = None) -> list[str]:
     """
     Extract affected component names from an Atom entry.
 
@@ -124,15 +508,10 @@ def _parse_components(entry) -> list[str]:
 
     # Method 2: Parse from content/summary text
     if not components:
-        raw = ""
-        if hasattr(entry, "content") and entry.content:
-            raw = entry.content[0].get("value", "")
-        elif hasattr(entry, "summary"):
-            raw = entry.summary or ""
-
-        text = strip_html(raw)
+        if body is None:
+            body = _entry_body(entry)
         # Look for lines matching "ComponentName (Status)" pattern
-        for line in text.split("\n"):
+        for line in body.lines:
             line = line.strip("- ").strip()
             if "(" in line and ")" in line:
                 components.append(line)
@@ -140,12 +519,12 @@ def _parse_components(entry) -> list[str]:
     return components
 
 
-def _parse_status(entry) -> str:
+def _parse_status(entry, body: _EntryBody | None = None) -> str:
     """Determine the current status string for an incident entry."""
     # Check for explicit status in tags
     if hasattr(entry, "tags") and entry.tags:
         for tag in entry.tags:
-            label = tag.get("label", "").lower()
+            label = (tag.get("label") or "").lower()
             if label in (
                 "investigating",
                 "identified",
@@ -158,16 +537,11 @@ def _parse_status(entry) -> str:
                 return tag.get("label", label)
 
     # Fallback: extract from content
-    raw = ""
-    if hasattr(entry, "content") and entry.content:
-        raw = entry.content[0].get("value", "")
-    elif hasattr(entry, "summary"):
-        raw = entry.summary or ""
-
-    text = strip_html(raw)
+    if body is None:
+        body = _entry_body(entry)
 
     # Keyword-based detection
-    lower = text.lower()
+    lower = body.text.lower()
     if "resolved" in lower or "fully recovered" in lower:
         return "Resolved"
     if "monitoring" in lower:
@@ -182,18 +556,14 @@ def _parse_status(entry) -> str:
     return "Unknown"
 
 
-def _parse_latest_message(entry) -> str:
+def _parse_latest_message(entry, body: _EntryBody | None = None) -> str:
     """Extract the most recent human-readable update message."""
-    raw = ""
-    if hasattr(entry, "content") and entry.content:
-        raw = entry.content[0].get("value", "")
-    elif hasattr(entry, "summary"):
-        raw = entry.summary or ""
-
-    text = strip_html(raw)
+    if body is None:
+        body = _entry_body(entry)
+    text = body.text
 
     # The first meaningful sentence is usually the latest update
-    for line in text.split("\n"):
+    for line in body.lines:
         line = line.strip()
         if line and "(" not in line:
             return line
@@ -205,224 +575,2854 @@ def _parse_timestamp(entry) -> datetime:
     """Parse the updated/published timestamp from the entry."""
     time_struct = entry.get("updated_parsed") or entry.get("published_parsed")
     if time_struct:
-        from calendar import timegm
-
         return datetime.fromtimestamp(timegm(time_struct), tz=timezone.utc)
     return datetime.now(tz=timezone.utc)
 
 
+def _entry_id(entry) -> str:
+    """Return the incident ID of a raw feed entry."""
+    return entry.get("id", entry.get("link", ""))
+
+
+def _entry_key(entry) -> int:
+    """
+    Return the change-detection key (updated time, epoch seconds) of a raw entry.
+
+    Reads only the parsed time struct, so unchanged entries are skipped
+    without building a datetime or touching their HTML content.  Entries
+    without any timestamp get 0.
+    """
+    time_struct = entry.get("updated_parsed") or entry.get("published_parsed")
+    return timegm(time_struct) if time_struct else 0
+
+
+def _fingerprint(*parts: str) -> int:
+    """64-bit signed digest of ``parts`` (fits an SQLite INTEGER); never 0."""
+    digest = hashlib.blake2b("\0".join(parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True) or 1
+
+
+def _entry_fingerprint(entry) -> int:
+    """
+    Content fingerprint of an entry: title, raw content and categories
+    (scheme, term and label; the status may live in the label).
+
+    Hashes the raw HTML rather than the stripped text, so it costs one
+    digest per entry and no HTML parsing.
+    """
+    tags = getattr(entry, "tags", None) or ()
+    return _fingerprint(
+        entry.get("title") or "",
+        _entry_raw_content(entry),
+        *(
+            "|".join(tag.get(key) or "" for key in ("scheme", "term", "label"))
+            for tag in tags
+        ),
+    )
+
+
 def parse_incident(entry) -> IncidentUpdate:
     """Convert a feedparser entry into an IncidentUpdate."""
+    # Decode the content once; every extractor shares the result.
+    body = _entry_body(entry)
     return IncidentUpdate(
-        id=entry.get("id", entry.get("link", "")),
+        id=_entry_id(entry),
         title=entry.get("title", "Unknown Incident"),
         link=entry.get("link", ""),
-        status=_parse_status(entry),
-        affected_components=_parse_components(entry),
-        latest_message=_parse_latest_message(entry),
+        status=_parse_status(entry, body),
+        affected_components=_parse_components(entry, body),
+        latest_message=_parse_latest_message(entry, body),
         updated_at=_parse_timestamp(entry),
     )
 
 
 # ---------------------------------------------------------------------------
-# Console callback (default event handler)
+# Streaming Atom parser
 # ---------------------------------------------------------------------------
-def on_incident_update(page_name: str, incident: IncidentUpdate) -> None:
-    """Default callback — pretty-prints an incident update to stdout."""
-    timestamp = incident.updated_at.strftime("%Y-%m-%d %H:%M:%S")
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_XML_BASE = "{http://www.w3.org/XML/1998/namespace}base"
+STREAM_CHUNK_SIZE = 16 * 1024
 
-    print()
-    print("=" * 70)
 
-    if incident.affected_components:
-        for component in incident.affected_components:
-            print(f"[{timestamp}] Product: {page_name} - {component}")
-    else:
-        print(f"[{timestamp}] Product: {page_name}")
+class FeedEntry(dict):
+    """
+    A parsed Atom entry.
 
-    print(f"  Incident: {incident.title}")
-    print(f"  Status:   {incident.status}")
-    print(f"  Message:  {incident.latest_message}")
-    print(f"  Link:     {incident.link}")
-    print("=" * 70)
+    Mirrors the subset of feedparser's entry interface that the extractors
+    use: dict access (``entry.get("id")``) plus attribute access
+    (``entry.tags``, ``entry.content``, ``entry.summary``).
+    """
 
+    def __getattr__(self, name: str):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
-# ---------------------------------------------------------------------------
-# Core monitor class
-# ---------------------------------------------------------------------------
-class StatusPageMonitor:
+
+def _parse_atom_date(value: str | None) -> time.struct_time | None:
+    """Parse an RFC 3339 Atom date into a UTC struct_time."""
+    if not value:
+        return None
+    try:
+        # RFC 3339 allows a lowercase "t" and "z"; fromisoformat does not
+        dt = datetime.fromisoformat(value.strip().upper().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt.utctimetuple()
+
+
+def _atom_text(elem: ET.Element | None) -> str:
+    """Return the text of an Atom text construct (text, html or xhtml)."""
+    if elem is None:
+        return ""
+    if elem.get("type") == "xhtml":
+        return "".join(
+            ET.tostring(child, encoding="unicode", method="html") for child in elem
+        ).strip()
+    return (elem.text or "").strip()
+
+
+def _atom_entry(elem: ET.Element, base: str = "") -> FeedEntry:
     """
-    Async monitor for an incident.io-powered status page.
+    Convert an <entry> element into a FeedEntry.
 
-    Uses HTTP conditional requests (ETag) so the server returns
-    304 Not Modified when the feed hasn't changed — no wasted bandwidth.
+    Relative link hrefs are resolved against ``xml:base`` (``base`` is the
+    feed-level one), as feedparser does.
+    """
+    entry = FeedEntry()
+    base = urljoin(base, elem.get(_XML_BASE, ""))
+
+    id_elem = elem.find(f"{_ATOM}id")
+    if id_elem is not None and id_elem.text:
+        entry["id"] = id_elem.text.strip()
+
+    title = elem.find(f"{_ATOM}title")
+    if title is not None:
+        entry["title"] = _atom_text(title)
+
+    # Prefer rel="alternate" (the default rel), else the first link
+    links = elem.findall(f"{_ATOM}link")
+    for link in links:
+        if link.get("rel", "alternate") == "alternate":
+            break
+    else:
+        link = links[0] if links else None
+    if link is not None:
+        href = link.get("href", "")
+        entry["link"] = urljoin(urljoin(base, link.get(_XML_BASE, "")), href)
+
+    for field in ("updated", "published"):
+        node = elem.find(f"{_ATOM}{field}")
+        if node is not None and node.text:
+            entry[field] = node.text.strip()
+            entry[f"{field}_parsed"] = _parse_atom_date(node.text)
+
+    entry["tags"] = [
+        {
+            "term": cat.get("term"),
+            "scheme": cat.get("scheme"),
+            "label": cat.get("label"),
+        }
+        for cat in elem.findall(f"{_ATOM}category")
+    ]
 
-    Multiple instances can run concurrently in a single asyncio loop,
-    making it trivial to scale to 100+ status pages.
+    content = elem.find(f"{_ATOM}content")
+    summary = elem.find(f"{_ATOM}summary")
+    if content is not None:
+        entry["content"] = [
+            {"type": content.get("type", "text"), "value": _atom_text(content)}
+        ]
+    if summary is not None:
+        entry["summary"] = _atom_text(summary)
+    elif content is not None:
+        entry["summary"] = entry["content"][0]["value"]
+
+    return entry
+
+
+class AtomStreamParser:
     """
+    Incremental Atom parser.
 
-    def __init__(
-        self,
-        name: str,
-        feed_url: str,
-        callback: Callable[[str, IncidentUpdate], None] | None = None,
-        poll_interval: int = 60,
-    ):
-        """
-        Parameters
-        ----------
-        name : str
-            Human-readable name for this status page (e.g. "OpenAI API").
-        feed_url : str
-            URL to the Atom/RSS feed (e.g. https://status.openai.com/history.atom).
-        callback : callable, optional
-            Function called with (page_name, IncidentUpdate) on each new/updated
-            incident.  Defaults to on_incident_update (console printer).
-        poll_interval : int
-            Seconds between conditional-fetch cycles.  Default 60.
-        """
-        self.name = name
-        self.feed_url = feed_url
-        self.callback = callback or on_incident_update
-        self.poll_interval = poll_interval
+    Feed it raw byte chunks as they arrive; each call returns the entries
+    completed so far.  Finished <entry> elements are detached from the tree
+    immediately, so memory stays bounded by the largest single entry rather
+    than the whole document.
+    """
 
-        # Conditional-request state
-        self._etag: str | None = None
-        self._last_modified: str | None = None
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root: ET.Element | None = None
+
+    def feed(self, chunk: bytes) -> list[FeedEntry]:
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> list[FeedEntry]:
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> list[FeedEntry]:
+        entries: list[FeedEntry] = []
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+            elif elem.tag == f"{_ATOM}entry":
+                base = self._root.get(_XML_BASE, "") if self._root is not None else ""
+                entries.append(_atom_entry(elem, base))
+                if self._root is not None and elem in self._root:
+                    self._root.remove(elem)
+        return entries
 
-        # Change-detection state: maps incident ID -> last-seen updated timestamp
-        self._seen_incidents: dict[str, str] = {}
 
-        # Graceful shutdown
-        self._running = False
+# ---------------------------------------------------------------------------
+# Source adapters
+# ---------------------------------------------------------------------------
+class MalformedFeedError(ValueError):
+    """Raised when a feed body cannot be parsed into any entries."""
 
-    async def start(self) -> None:
-        """Begin the async monitoring loop."""
-        self._running = True
-        logger.info(
-            ">> Starting monitor for '%s' (feed: %s, interval: %ds)",
-            self.name,
-            self.feed_url,
-            self.poll_interval,
-        )
 
-        async with aiohttp.ClientSession() as session:
-            # Initial fetch — show all current incidents
-            await self._check_feed(session, initial=True)
+class FeedSource:
+    """
+    Adapter between a status page's wire format and IncidentUpdate.
+
+    ``parse`` turns a raw response body (undecoded bytes; honouring the
+    declared encoding is the parser's job) into entries.  ``entry_id``,
+    ``entry_key`` (update time) and ``fingerprint`` (content digest) must
+    be cheap, as they run for every entry on every 200, while
+    ``to_incident`` does the full conversion and only runs for new or
+    changed entries.  Adapters are stateless so they can be sent to a
+    process pool.
+    """
 
-            while self._running:
-                await asyncio.sleep(self.poll_interval)
-                if not self._running:
-                    break
-                await self._check_feed(session, initial=False)
+    name = "base"
 
-        logger.info("-- Monitor for '%s' stopped.", self.name)
+    def parse(self, body: bytes | str) -> list:
+        raise NotImplementedError
 
-    def stop(self) -> None:
-        """Signal the monitor to stop after the current cycle."""
-        self._running = False
+    def entry_id(self, entry) -> str:
+        raise NotImplementedError
 
-    async def _check_feed(
-        self, session: aiohttp.ClientSession, initial: bool = False
-    ) -> None:
-        """Fetch the feed (conditionally) and process any new incidents."""
-        headers: dict[str, str] = {}
-        if self._etag:
-            headers["If-None-Match"] = self._etag
-        if self._last_modified:
-            headers["If-Modified-Since"] = self._last_modified
+    def entry_key(self, entry) -> int:
+        raise NotImplementedError
 
-        try:
-            async with session.get(
-                self.feed_url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)
-            ) as resp:
-                if resp.status == 304:
-                    logger.debug(
-                        "No changes for '%s' (304 Not Modified).", self.name
-                    )
-                    return
+    def fingerprint(self, entry) -> int:
+        raise NotImplementedError
 
-                if resp.status != 200:
-                    logger.warning(
-                        "Unexpected status %d from '%s'.", resp.status, self.name
-                    )
-                    return
+    def to_incident(self, entry) -> IncidentUpdate:
+        raise NotImplementedError
 
-                # Update conditional-request tokens
-                self._etag = resp.headers.get("ETag")
-                self._last_modified = resp.headers.get("Last-Modified")
 
-                body = await resp.text()
+class AtomSource(FeedSource):
+    """Atom/RSS feeds via feedparser, with HTML scraping of entry content."""
 
-        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
-            logger.error("Network error for '%s': %s", self.name, exc)
-            return
+    name = "atom"
 
-        # Parse
+    def parse(self, body: bytes | str) -> list:
         feed = feedparser.parse(body)
         if feed.bozo and not feed.entries:
-            logger.warning("Malformed feed from '%s': %s", self.name, feed.bozo_exception)
-            return
+            raise MalformedFeedError(str(feed.bozo_exception))
+        return feed.entries
 
-        self._process_entries(feed.entries, initial)
+    def entry_id(self, entry) -> str:
+        return _entry_id(entry)
 
-    def _process_entries(self, entries: list, initial: bool) -> None:
-        """Detect new/updated incidents and fire callbacks."""
-        new_seen: dict[str, str] = {}
+    def entry_key(self, entry) -> int:
+        return _entry_key(entry)
 
-        for entry in entries:
-            incident = parse_incident(entry)
-            updated_key = incident.updated_at.isoformat()
-            new_seen[incident.id] = updated_key
+    def fingerprint(self, entry) -> int:
+        return _entry_fingerprint(entry)
 
-            # On initial run, show all incidents to give immediate context
-            if initial:
-                self.callback(self.name, incident)
-                continue
+    def to_incident(self, entry) -> IncidentUpdate:
+        return parse_incident(entry)
 
-            # On subsequent runs, only fire if this is new or updated
-            prev = self._seen_incidents.get(incident.id)
-            if prev is None:
-                logger.info("[NEW] Incident detected: %s", incident.title)
-                self.callback(self.name, incident)
-            elif prev != updated_key:
-                logger.info("[UPDATED] Incident updated: %s", incident.title)
-                self.callback(self.name, incident)
 
-        self._seen_incidents = new_seen
+# Statuspage API incident status -> display status used by the Atom path
+_JSON_STATUSES = {
+    "investigating": "Investigating",
+    "identified": "Identified",
+    "monitoring": "Monitoring",
+    "resolved": "Resolved",
+    "postmortem": "Resolved",
+    "scheduled": "Scheduled",
+    "in_progress": "In Progress",
+    "verifying": "Monitoring",
+    "completed": "Resolved",
+}
 
 
-# ---------------------------------------------------------------------------
-# Multi-page runner
-# ---------------------------------------------------------------------------
-async def run_monitors(monitors: list[StatusPageMonitor]) -> None:
-    """Run multiple status page monitors concurrently."""
-    # Handle graceful shutdown on SIGINT / SIGTERM
-    loop = asyncio.get_running_loop()
+def _iso_epoch(value: str | None) -> int:
+    """Epoch seconds of an ISO 8601 timestamp (0 when missing/invalid)."""
+    if not value:
+        return 0
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return 0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
 
-    def _shutdown():
-        logger.info("Shutdown signal received — stopping all monitors…")
-        for m in monitors:
-            m.stop()
 
-    # Register signal handlers (Unix-only; on Windows we rely on KeyboardInterrupt)
-    if sys.platform != "win32":
-        for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, _shutdown)
+class StatuspageJSONSource(FeedSource):
+    """
+    Statuspage-style JSON API (``/api/v2/incidents.json``).
 
-    tasks = [asyncio.create_task(m.start()) for m in monitors]
+    Incidents already carry structured status, components and updates, so
+    no HTML is parsed at all.
+    """
 
-    try:
-        await asyncio.gather(*tasks)
-    except asyncio.CancelledError:
-        pass
+    name = "json"
+
+    def parse(self, body: bytes | str) -> list:
+        try:
+            doc = json.loads(body)
+        except ValueError as exc:
+            raise MalformedFeedError(str(exc)) from None
+        incidents = doc.get("incidents") if isinstance(doc, dict) else None
+        if not isinstance(incidents, list):
+            raise MalformedFeedError("JSON body has no 'incidents' list")
+        return incidents
+
+    def entry_id(self, entry) -> str:
+        return str(entry.get("id", ""))
+
+    def entry_key(self, entry) -> int:
+        return _iso_epoch(entry.get("updated_at") or entry.get("created_at"))
+
+    def fingerprint(self, entry) -> int:
+        updates = entry.get("incident_updates") or [{}]
+        return _fingerprint(
+            entry.get("name") or "",
+            entry.get("status") or "",
+            updates[0].get("body") or "",
+            *(
+                f"{c.get('name')}={c.get('status')}"
+                for c in entry.get("components") or []
+            ),
+        )
+
+    def to_incident(self, entry) -> IncidentUpdate:
+        status = entry.get("status") or ""
+        updates = entry.get("incident_updates") or []
+        message = (updates[0].get("body") or "").strip() if updates else ""
+        epoch = self.entry_key(entry)
+        return IncidentUpdate(
+            id=self.entry_id(entry),
+            title=entry.get("name") or "Unknown Incident",
+            link=entry.get("shortlink") or "",
+            status=_JSON_STATUSES.get(status, status.replace("_", " ").title()),
+            affected_components=[
+                c["name"] for c in entry.get("components") or [] if c.get("name")
+            ],
+            latest_message=message or "(no message)",
+            updated_at=(
+                datetime.fromtimestamp(epoch, tz=timezone.utc)
+                if epoch
+                else datetime.now(tz=timezone.utc)
+            ),
+        )
+
+
+class LeanAtomSource(AtomSource):
+    """
+    Atom feeds via the stdlib XML parser instead of feedparser.
+
+    Builds the same entries the streaming parser does (id, title, link,
+    updated/published, categories, content/summary) and nothing else: no
+    HTML sanitizing, rewriting of URIs inside content or date-format
+    sniffing; entry links are still resolved against ``xml:base``.  Atom
+    only; RSS feeds need the feedparser engine.
+
+    Content is fingerprinted as received rather than sanitized, so
+    fingerprints differ from the feedparser engine's: switching engines on
+    a persisted state store reports every incident as updated once.
+    """
+
+    name = "atom-lean"
+
+    def parse(self, body: bytes | str) -> list:
+        try:
+            root = ET.fromstring(body)
+        except ET.ParseError as exc:
+            raise MalformedFeedError(str(exc)) from None
+        if root.tag != f"{_ATOM}feed":
+            raise MalformedFeedError(f"Not an Atom feed (root {root.tag!r})")
+        base = root.get(_XML_BASE, "")
+        return [_atom_entry(elem, base) for elem in root.iterfind(f"{_ATOM}entry")]
+
+
+ATOM_SOURCE = AtomSource()
+LEAN_ATOM_SOURCE = LeanAtomSource()
+JSON_SOURCE = StatuspageJSONSource()
+SOURCES: dict[str, FeedSource] = {"atom": ATOM_SOURCE, "json": JSON_SOURCE}
+
+# Engines for buffered Atom bodies (streaming always uses AtomStreamParser)
+PARSER_ENGINES: dict[str, AtomSource] = {
+    "feedparser": ATOM_SOURCE,
+    "lean": LEAN_ATOM_SOURCE,
+}
+
+# Path of the Statuspage incidents API relative to the page root
+JSON_API_PATH = "/api/v2/incidents.json"
+
+
+def _json_api_url(feed_url: str) -> str:
+    """Guess the JSON API URL for a page from its feed URL."""
+    parts = urlsplit(feed_url)
+    path = parts.path
+    for suffix in ("/history.atom", "/history.rss", JSON_API_PATH):
+        if path.endswith(suffix):
+            path = path[: -len(suffix)]
+            break
+    return f"{parts.scheme}://{parts.netloc}{path.rstrip('/')}{JSON_API_PATH}"
+
+
+# ---------------------------------------------------------------------------
+# Change scan (runs in the loop or in a parse executor)
+# ---------------------------------------------------------------------------
+# (incident id, update time, content fingerprint, incident if converted)
+ScannedEntry = tuple[str, int, int, IncidentUpdate | None]
+
+# Seen-state value for incidents whose fingerprint is not known yet
+# (restored from a database written before fingerprints existed)
+UNKNOWN_FINGERPRINT = 0
+
+
+def scan_entries(
+    entries: list,
+    seen: dict[str, int],
+    initial: bool,
+    source: FeedSource = ATOM_SOURCE,
+) -> list[ScannedEntry]:
+    """
+    Compare raw entries against seen state, parsing only what changed.
+
+    ``seen`` maps incident IDs to content fingerprints, so an edit that
+    keeps the timestamp counts as a change and a timestamp bump with
+    identical content does not.  The full conversion to IncidentUpdate is
+    done only for new or changed entries (or for all of them on the
+    initial run).
+    """
+    scanned: list[ScannedEntry] = []
+    for entry in entries:
+        # Fast path: compare id + fingerprint before doing any parsing
+        incident_id = source.entry_id(entry)
+        fingerprint = source.fingerprint(entry)
+        incident = None
+        if initial or seen.get(incident_id) != fingerprint:
+            incident = source.to_incident(entry)
+        scanned.append(
+            (incident_id, source.entry_key(entry), fingerprint, incident)
+        )
+    return scanned
+
+
+def parse_feed_body(
+    body: bytes | str,
+    seen: dict[str, int],
+    initial: bool,
+    source: FeedSource = ATOM_SOURCE,
+) -> list[ScannedEntry]:
+    """
+    Parse a buffered feed body and scan it for changes.
+
+    A module-level function so it can be shipped to a process pool; only
+    the compact scan results travel back to the event loop.
+    """
+    return scan_entries(source.parse(body), seen, initial, source)
+
+
+def create_parse_executor(
+    mode: str = "process", workers: int | None = None
+) -> concurrent.futures.Executor:
+    """
+    Create an executor for off-loop feed parsing.
+
+    ``mode`` is "process" (true parallelism for CPU-bound parsing) or
+    "thread" (cheaper to start, still keeps parsing out of the loop's
+    time slices).  ``workers`` defaults to the executor's own default.
+    """
+    if mode == "process":
+        return concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    if mode == "thread":
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="feed-parse"
+        )
+    raise ValueError(f"Unknown parse executor mode: {mode!r}")
+
+
+# ---------------------------------------------------------------------------
+# Persistent polling state
+# ---------------------------------------------------------------------------
+class FeedState:
+    """Conditional-request tokens and seen incidents for one feed."""
+
+    __slots__ = ("etag", "last_modified", "seen")
+
+    def __init__(
+        self,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        seen: dict[str, int] | None = None,
+    ):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.seen = seen if seen is not None else {}
+
+
+class StateStore:
+    """
+    Pluggable persistence for per-feed polling state.
+
+    The base class stores nothing (in-memory only behaviour).  Subclasses
+    are loaded once per monitor at startup and then written incrementally:
+    validators after every 200, incident rows only when they change.
+    """
+
+    def load(self, feed_url: str) -> FeedState | None:
+        return None
+
+    def save_validators(
+        self, feed_url: str, etag: str | None, last_modified: str | None
+    ) -> None:
+        pass
+
+    def save_incidents(
+        self, feed_url: str, changed: dict[str, int], removed: list[str]
+    ) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteStateStore(StateStore):
+    """StateStore backed by a local SQLite database (WAL mode)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS feeds (
+                feed TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT
+            );
+            CREATE TABLE IF NOT EXISTS incidents (
+                feed TEXT NOT NULL,
+                incident_id TEXT NOT NULL,
+                fingerprint INTEGER NOT NULL,
+                PRIMARY KEY (feed, incident_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        columns = {
+            row[1] for row in self._db.execute("PRAGMA table_info(incidents)")
+        }
+        if "fingerprint" not in columns:
+            # Older databases stored update times: keep the rows (the
+            # incidents are known) but mark their content as unknown
+            self._db.execute(
+                "ALTER TABLE incidents RENAME COLUMN updated TO fingerprint"
+            )
+            self._db.execute(
+                "UPDATE incidents SET fingerprint = ?", (UNKNOWN_FINGERPRINT,)
+            )
+        self._db.commit()
+
+    def load(self, feed_url: str) -> FeedState | None:
+        row = self._db.execute(
+            "SELECT etag, last_modified FROM feeds WHERE feed = ?", (feed_url,)
+        ).fetchone()
+        seen = dict(
+            self._db.execute(
+                "SELECT incident_id, fingerprint FROM incidents WHERE feed = ?",
+                (feed_url,),
+            )
+        )
+        if row is None and not seen:
+            return None
+        etag, last_modified = row or (None, None)
+        return FeedState(etag, last_modified, seen)
+
+    def save_validators(
+        self, feed_url: str, etag: str | None, last_modified: str | None
+    ) -> None:
+        self._db.execute(
+            "INSERT INTO feeds (feed, etag, last_modified) VALUES (?, ?, ?) "
+            "ON CONFLICT(feed) DO UPDATE SET "
+            "etag = excluded.etag, last_modified = excluded.last_modified",
+            (feed_url, etag, last_modified),
+        )
+        self._db.commit()
+
+    def save_incidents(
+        self, feed_url: str, changed: dict[str, int], removed: list[str]
+    ) -> None:
+        if not changed and not removed:
+            return
+        self._db.executemany(
+            "INSERT OR REPLACE INTO incidents (feed, incident_id, fingerprint) "
+            "VALUES (?, ?, ?)",
+            [(feed_url, iid, fp) for iid, fp in changed.items()],
+        )
+        self._db.executemany(
+            "DELETE FROM incidents WHERE feed = ? AND incident_id = ?",
+            [(feed_url, iid) for iid in removed],
+        )
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def open_state_store(path: str | None) -> StateStore:
+    """SQLiteStateStore at ``path``, or the no-op StateStore if none is given."""
+    return SQLiteStateStore(path) if path else StateStore()
+
+
+# ---------------------------------------------------------------------------
+# Console callback (default event handler)
+# ---------------------------------------------------------------------------
+def on_incident_update(page_name: str, incident: IncidentUpdate) -> None:
+    """Default callback — pretty-prints an incident update to stdout."""
+    timestamp = incident.updated_at.strftime("%Y-%m-%d %H:%M:%S")
+
+    print()
+    print("=" * 70)
+
+    if incident.affected_components:
+        for component in incident.affected_components:
+            print(f"[{timestamp}] Product: {page_name} - {component}")
+    else:
+        print(f"[{timestamp}] Product: {page_name}")
+
+    print(f"  Incident: {incident.title}")
+    print(f"  Status:   {incident.status}")
+    print(f"  Message:  {incident.latest_message}")
+    print(f"  Link:     {incident.link}")
+    print("=" * 70)
+
+
+# ---------------------------------------------------------------------------
+# Callback dispatch
+# ---------------------------------------------------------------------------
+# A sink may be a plain function or an ``async def`` coroutine function
+IncidentCallback = Callable[[str, IncidentUpdate], Awaitable[None] | None]
+
+DISPATCH_QUEUE_SIZE = 1000
+DISPATCH_WORKERS = 4
+DISPATCH_POLICIES = ("block", "drop-oldest", "coalesce")
+
+
+async def _invoke_callback(
+    callback: IncidentCallback, page_name: str, incident: IncidentUpdate
+) -> None:
+    """Call a sync or async callback, logging (not raising) its errors."""
+    started = time.perf_counter()
+    try:
+        result = callback(page_name, incident)
+        if inspect.isawaitable(result):
+            await result
+    except Exception:
+        logger.exception("Callback failed for '%s' (%s).", page_name, incident.id)
+    finally:
+        metrics.observe(
+            "status_tracker_callback_seconds", time.perf_counter() - started
+        )
+
+
+class CallbackDispatcher:
+    """
+    Bounded queue plus worker tasks that run incident callbacks.
+
+    Decouples polling from sink latency: monitors enqueue events and move
+    on, workers deliver them.  When the queue is full the policy decides:
+
+      - ``block``:       accept the event, but monitors wait for room
+                         before their next fetch (backpressure on polling)
+      - ``drop-oldest``: discard the oldest queued event
+      - ``coalesce``:    a queued event for the same page + incident ID is
+                         replaced by the newer one (at any queue length);
+                         new incidents on a full queue fall back to ``block``
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DISPATCH_QUEUE_SIZE,
+        workers: int = DISPATCH_WORKERS,
+        policy: str = "block",
+    ):
+        if policy not in DISPATCH_POLICIES:
+            raise ValueError(f"Unknown dispatch policy: {policy!r}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self._workers = workers
+        self._pending: OrderedDict[object, tuple] = OrderedDict()
+        self._seq = itertools.count()
+        self._tasks: list[asyncio.Task] = []
+        self._not_empty = asyncio.Event()
+        self._has_room = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._busy = 0
+
+        self.submitted = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def start(self) -> None:
+        """Spawn the worker tasks (must be called inside a running loop)."""
+        for _ in range(self._workers):
+            self._tasks.append(asyncio.create_task(self._worker()))
+
+    async def close(self) -> None:
+        """Deliver everything still queued, then stop the workers."""
+        await self.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def join(self) -> None:
+        """Wait until the queue is empty and no callback is running."""
+        while self._pending or self._busy:
+            self._idle.clear()
+            await self._idle.wait()
+
+    def submit(
+        self, callback: IncidentCallback, page_name: str, incident: IncidentUpdate
+    ) -> None:
+        """Enqueue an event without blocking."""
+        self.submitted += 1
+        item = (callback, page_name, incident)
+
+        if self.policy == "coalesce":
+            key = (page_name, incident.id)
+            if key in self._pending:
+                self._pending[key] = item
+                self.coalesced += 1
+                return
+        else:
+            key = next(self._seq)
+            if self.policy == "drop-oldest" and len(self._pending) >= self.maxsize:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+
+        self._pending[key] = item
+        self._idle.clear()
+        self._not_empty.set()
+
+    async def wait_for_capacity(self) -> None:
+        """Return once the queue is below its size limit."""
+        while len(self._pending) >= self.maxsize:
+            self._has_room.clear()
+            await self._has_room.wait()
+
+    async def _worker(self) -> None:
+        while True:
+            if not self._pending:
+                self._not_empty.clear()
+                await self._not_empty.wait()
+                continue
+
+            _, (callback, page_name, incident) = self._pending.popitem(last=False)
+            if len(self._pending) < self.maxsize:
+                self._has_room.set()
+
+            self._busy += 1
+            try:
+                await _invoke_callback(callback, page_name, incident)
+            finally:
+                self._busy -= 1
+                if not self._pending and not self._busy:
+                    self._idle.set()
+
+
+# ---------------------------------------------------------------------------
+# Compressed transfer
+# ---------------------------------------------------------------------------
+def _optional_codecs() -> list[str]:
+    codecs = []
+    try:
+        import brotli  # noqa: F401
+
+        codecs.append("br")
+    except ImportError:
+        pass
+    try:
+        import zstandard  # noqa: F401
+
+        codecs.append("zstd")
+    except ImportError:
+        pass
+    return codecs
+
+
+# gzip/deflate always; br and zstd when brotli / zstandard are installed
+ACCEPT_ENCODING = ", ".join(["gzip", "deflate", *_optional_codecs()])
+
+
+class _Identity:
+    __slots__ = ()
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _Deflate:
+    """zlib-wrapped deflate, falling back to raw deflate (both are seen)."""
+
+    __slots__ = ("_obj", "_started")
+
+    def __init__(self):
+        self._obj = zlib.decompressobj()
+        self._started = False
+
+    def decompress(self, data: bytes) -> bytes:
+        if not self._started:
+            self._started = True
+            try:
+                return self._obj.decompress(data)
+            except zlib.error:
+                self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._obj.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+class _Brotli:
+    __slots__ = ("_obj",)
+
+    def __init__(self):
+        import brotli
+
+        self._obj = brotli.Decompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _Zstd:
+    __slots__ = ("_obj",)
+
+    def __init__(self):
+        import zstandard
+
+        self._obj = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._obj.decompress(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+class _Gzip:
+    __slots__ = ("_obj",)
+
+    def __init__(self):
+        self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._obj.decompress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+
+_DECOMPRESSORS = {
+    "gzip": _Gzip,
+    "x-gzip": _Gzip,
+    "deflate": _Deflate,
+    "br": _Brotli,
+    "zstd": _Zstd,
+}
+
+
+class BodyDecoder:
+    """
+    Incrementally decode a response body, counting bytes on both sides.
+
+    Chunks are decompressed as they arrive, so a streaming parser sees
+    decoded data without the whole body ever being inflated into one
+    buffer.  When the session already decompresses (a plain aiohttp
+    session with ``auto_decompress=True``), chunks pass through and only
+    the decoded size is known.
+    """
+
+    __slots__ = ("_codec", "wire_bytes", "decoded_bytes")
+
+    def __init__(self, content_encoding: str | None, raw: bool = True):
+        encoding = (content_encoding or "identity").strip().lower()
+        if not raw or encoding == "identity":
+            self._codec = _Identity()
+        elif encoding in _DECOMPRESSORS:
+            try:
+                self._codec = _DECOMPRESSORS[encoding]()
+            except ImportError:
+                raise MalformedFeedError(
+                    f"No decoder installed for Content-Encoding {encoding!r}"
+                ) from None
+        else:
+            raise MalformedFeedError(f"Unsupported Content-Encoding {encoding!r}")
+        self.wire_bytes = 0 if raw else None
+        self.decoded_bytes = 0
+
+    def decode(self, chunk: bytes) -> bytes:
+        if self.wire_bytes is not None:
+            self.wire_bytes += len(chunk)
+        try:
+            data = self._codec.decompress(chunk)
+        except Exception as exc:  # zlib.error, brotli.error, ZstdError
+            raise MalformedFeedError(f"Corrupt compressed body: {exc}") from None
+        self.decoded_bytes += len(data)
+        return data
+
+    def flush(self) -> bytes:
+        try:
+            data = self._codec.flush()
+        except Exception as exc:
+            raise MalformedFeedError(f"Corrupt compressed body: {exc}") from None
+        self.decoded_bytes += len(data)
+        return data
+
+    async def iter_decoded(self, resp, chunk_size: int = STREAM_CHUNK_SIZE):
+        """Yield decoded chunks of ``resp``'s body as they arrive."""
+        async for chunk in resp.content.iter_chunked(chunk_size):
+            data = self.decode(chunk)
+            if data:
+                yield data
+        tail = self.flush()
+        if tail:
+            yield tail
+
+    async def read(self, resp) -> bytes:
+        """The whole decoded body."""
+        return b"".join([chunk async for chunk in self.iter_decoded(resp)])
+
+
+# ---------------------------------------------------------------------------
+# HTTP caching
+# ---------------------------------------------------------------------------
+CACHE_MAX_FRESHNESS = 900  # seconds; cap on a server-declared lifetime
+PERMANENT_REDIRECTS = (301, 308)
+
+
+def _freshness_lifetime(headers) -> float | None:
+    """
+    Seconds a response stays fresh per Cache-Control / Expires.
+
+    Follows RFC 9111 for a private cache: ``max-age`` (less ``Age``) wins
+    over ``Expires``; ``no-store`` / ``no-cache`` mean zero.  Returns None
+    when the response says nothing about freshness.
+    """
+    directives: dict[str, str] = {}
+    for part in (headers.get("Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip().strip('"')
+
+    if "no-store" in directives or "no-cache" in directives:
+        return 0.0
+    if "max-age" in directives:
+        try:
+            lifetime = float(int(directives["max-age"]))
+        except ValueError:
+            return 0.0
+    elif headers.get("Expires"):
+        try:
+            expires = parsedate_to_datetime(headers["Expires"])
+            date = (
+                parsedate_to_datetime(headers["Date"])
+                if headers.get("Date")
+                else datetime.now(tz=timezone.utc)
+            )
+            lifetime = (expires - date).total_seconds()
+        except (TypeError, ValueError):
+            return 0.0  # invalid Expires (e.g. "0") means already expired
+    else:
+        return None
+
+    age = (headers.get("Age") or "").strip()
+    if age.isdigit():
+        lifetime -= int(age)
+    return max(lifetime, 0.0)
+
+
+# ---------------------------------------------------------------------------
+# Retries and circuit breaking
+# ---------------------------------------------------------------------------
+RETRY_ATTEMPTS = 2  # extra attempts after a transient failure
+RETRY_BASE_DELAY = 0.5  # seconds; doubles per attempt, fully jittered
+RETRY_AFTER_MAX = 3600  # never honour a Retry-After longer than this
+
+BREAKER_THRESHOLD = 5  # consecutive failed fetches before the circuit opens
+BREAKER_COOLDOWN = 30.0  # seconds; doubles while the host keeps failing
+BREAKER_MAX_COOLDOWN = 900.0
+
+# Returned by StatusPageMonitor._fetch when the attempt may be retried
+_TRANSIENT = object()
+
+
+class _Fetched:
+    """Result of one successful fetch: a buffered body or streamed entries."""
+
+    __slots__ = ("body", "entries", "complete")
+
+    def __init__(
+        self,
+        body: bytes | None = None,
+        entries: list | None = None,
+        complete: bool = True,
+    ):
+        self.body = body
+        self.entries = entries
+        self.complete = complete
+
+
+def _retry_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given retry attempt (1-based)."""
+    return random.uniform(0, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(tz=timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX)
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    Closed: every fetch goes through.  After ``threshold`` consecutive
+    failures it opens for ``cooldown`` seconds and fetches to the host are
+    skipped.  Once the cooldown has passed a single trial fetch is allowed
+    (half-open); success closes the circuit, failure re-opens it with the
+    cooldown doubled (up to ``max_cooldown``).
+    """
+
+    __slots__ = (
+        "threshold",
+        "base_cooldown",
+        "max_cooldown",
+        "failures",
+        "cooldown",
+        "open_until",
+        "_trial",
+    )
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+        max_cooldown: float = BREAKER_MAX_COOLDOWN,
+    ):
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.failures = 0
+        self.cooldown = cooldown
+        self.open_until = 0.0
+        self._trial = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.failures >= self.threshold
+
+    def allow(self) -> bool:
+        if not self.is_open:
+            return True
+        if self._trial or time.monotonic() < self.open_until:
+            return False
+        self._trial = True  # half-open: let exactly one fetch through
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.cooldown = self.base_cooldown
+        self._trial = False
+
+    def record_failure(self) -> None:
+        was_trial = self._trial
+        self._trial = False
+        self.failures += 1
+        if not self.is_open:
+            return
+        if was_trial:
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+        self.open_until = time.monotonic() + self.cooldown
+        logger.warning(
+            "Circuit opened after %d failures; backing off %.0fs.",
+            self.failures,
+            self.cooldown,
+        )
+
+
+# Breakers shared by every monitor in the process, keyed by host[:port]
+CIRCUIT_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+# ---------------------------------------------------------------------------
+# Core monitor class
+# ---------------------------------------------------------------------------
+# Statuses that mean an incident is still in progress (adaptive polling)
+UNRESOLVED_STATUSES = frozenset(
+    {
+        "investigating",
+        "identified",
+        "monitoring",
+        "degraded performance",
+        "partial outage",
+        "major outage",
+    }
+)
+
+ADAPTIVE_MIN_INTERVAL = 10  # seconds; poll rate during an active incident
+ADAPTIVE_MAX_INTERVAL = 600  # seconds; poll rate for long-quiet pages
+ADAPTIVE_BACKOFF_AFTER = 3  # consecutive quiet polls before backing off
+ADAPTIVE_BACKOFF_FACTOR = 2.0
+
+COALESCE_MAX_DELAY_FACTOR = 4  # default max delay, in coalescing windows
+
+
+class _PendingUpdate:
+    """Latest update for an incident while its coalescing window is open."""
+
+    __slots__ = ("incident", "deadline", "handle")
+
+    def __init__(
+        self, incident: IncidentUpdate, deadline: float, handle: asyncio.TimerHandle
+    ):
+        self.incident = incident
+        self.deadline = deadline
+        self.handle = handle
+
+
+class StatusPageMonitor:
+    """
+    Async monitor for an incident.io-powered status page.
+
+    Uses HTTP conditional requests (ETag) so the server returns
+    304 Not Modified when the feed hasn't changed — no wasted bandwidth.
+
+    Multiple instances can run concurrently in a single asyncio loop,
+    making it trivial to scale to 100+ status pages.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        feed_url: str,
+        callback: IncidentCallback | None = None,
+        poll_interval: int = 60,
+        session: aiohttp.ClientSession | None = None,
+        adaptive: bool = False,
+        min_interval: float = ADAPTIVE_MIN_INTERVAL,
+        max_interval: float = ADAPTIVE_MAX_INTERVAL,
+        state_store: StateStore | None = None,
+        streaming: bool = False,
+        parse_executor: concurrent.futures.Executor | None = None,
+        dispatcher: CallbackDispatcher | None = None,
+        coalesce_window: float | None = None,
+        coalesce_max_delay: float | None = None,
+        max_retries: int = RETRY_ATTEMPTS,
+        breakers: dict[str, CircuitBreaker] | None = None,
+        source: str = "atom",
+        parser_engine: str = "feedparser",
+        max_freshness: float = CACHE_MAX_FRESHNESS,
+    ):
+        """
+        Parameters
+        ----------
+        name : str
+            Human-readable name for this status page (e.g. "OpenAI API").
+        feed_url : str
+            URL to the Atom/RSS feed (e.g. https://status.openai.com/history.atom).
+        callback : callable, optional
+            Function called with (page_name, IncidentUpdate) on each new/updated
+            incident.  May be an ``async def`` function.  Defaults to
+            on_incident_update (console printer).
+        poll_interval : int
+            Seconds between conditional-fetch cycles.  Default 60.
+        session : aiohttp.ClientSession, optional
+            Shared HTTP session.  When omitted the monitor opens (and closes)
+            its own; run_monitors injects one session into all its monitors.
+        adaptive : bool
+            When True the effective interval follows feed activity: it drops
+            to ``min_interval`` while incidents are new, updated or unresolved,
+            and doubles after every few quiet polls (304s or unchanged 200s)
+            up to ``max_interval``.  Default False (fixed ``poll_interval``).
+        min_interval, max_interval : float
+            Floor and ceiling for the adaptive interval, in seconds.
+        state_store : StateStore, optional
+            Persists ETag/Last-Modified and seen incidents across restarts.
+            When saved state exists, the first poll is a conditional request
+            and only reports real changes instead of the full history.
+        streaming : bool
+            Parse the Atom body incrementally while it downloads and stop
+            reading once entries older than the newest already-seen update
+            are reached.  Assumes the feed is ordered by updated time, newest
+            first.  Default False (buffer the body and use feedparser).
+        parse_executor : concurrent.futures.Executor, optional
+            Run feed parsing and change scanning off the event loop (see
+            create_parse_executor).  Applies to buffered (non-streaming)
+            fetches; run_monitors can inject one shared executor.
+        dispatcher : CallbackDispatcher, optional
+            Deliver callbacks through a bounded queue and worker tasks instead
+            of calling them inline.  Without one, sync callbacks run inline
+            and async callbacks are scheduled as tasks.
+        coalesce_window : float, optional
+            Merge bursts of updates to the same incident: an update is held
+            for this many seconds and replaced by any newer update to the same
+            incident ID that arrives meanwhile; only the latest is emitted.
+            Default None (emit every update immediately).
+        coalesce_max_delay : float, optional
+            Upper bound on how long an update can be held while newer ones
+            keep arriving.  Defaults to four coalescing windows.
+        max_retries : int
+            Quick retries (jittered exponential backoff) after a network
+            error, timeout or 5xx before giving up until the next poll.
+        breakers : dict, optional
+            Host -> CircuitBreaker registry.  Defaults to the process-wide
+            CIRCUIT_BREAKERS so monitors on the same host share one breaker.
+        source : str
+            Wire format: "atom" (``feed_url`` is an Atom/RSS feed), "json"
+            (``feed_url`` is a Statuspage ``/api/v2/incidents.json``) or
+            "auto" (probe the page's JSON API once before the first poll and
+            use it when available, else fall back to ``feed_url``).  State is
+            keyed by ``feed_url`` whichever endpoint is fetched.
+        parser_engine : str
+            How buffered Atom bodies are parsed: "feedparser" (default;
+            also handles RSS) or "lean" (stdlib XML, Atom only, several
+            times faster).  Both produce the same IncidentUpdates, but
+            content fingerprints differ, so switching engines with a
+            persisted state store reports each incident as updated once.
+        max_freshness : float
+            Upper bound, in seconds, on how long a response marked fresh by
+            Cache-Control / Expires is served from local state before the
+            feed is revalidated.  0 ignores freshness and requests every
+            poll (for critical feeds).  Permanent redirects are remembered
+            either way.
+        """
+        self.name = name
+        self.feed_url = feed_url
+        self.callback = callback or on_incident_update
+        self.poll_interval = poll_interval
+        self._session = session
+
+        # Adaptive polling state
+        self.adaptive = adaptive
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._interval: float = min(max(poll_interval, min_interval), max_interval)
+        self._quiet_polls = 0
+        self._active_incidents: set[str] = set()
+
+        self._state_store = state_store or StateStore()
+
+        # Conditional-request state
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+
+        # Change-detection state: maps incident ID -> content fingerprint
+        # (a 64-bit int; see scan_entries)
+        self._seen_incidents: dict[str, int] = {}
+        # Current state of every incident parsed since start, keyed by ID.
+        # Entries are updated in place when the incident changes.
+        self._incidents: dict[str, IncidentUpdate] = {}
+        # Newest entry timestamp seen so far (epoch seconds); streaming cut-off
+        self._newest_seen: int | None = None
+
+        self.streaming = streaming
+        self._parse_executor = parse_executor
+        self._dispatcher = dispatcher
+        self._callback_tasks: set[asyncio.Task] = set()
+
+        # Burst coalescing: incident ID -> held update
+        self.coalesce_window = coalesce_window
+        self.coalesce_max_delay = (
+            coalesce_max_delay
+            if coalesce_max_delay is not None
+            else (coalesce_window or 0) * COALESCE_MAX_DELAY_FACTOR
+        )
+        self._pending_updates: dict[str, _PendingUpdate] = {}
+
+        # Failure handling
+        self.max_retries = max_retries
+        self._breakers = breakers if breakers is not None else CIRCUIT_BREAKERS
+        self._retry_after = 0.0  # server-requested delay before the next poll
+
+        # HTTP caching
+        self.max_freshness = max_freshness
+        self._fresh_until = 0.0  # monotonic time the last response goes stale
+
+        # Source adapter; None until "auto" detection has run
+        if source != "auto" and source not in SOURCES:
+            raise ValueError(f"Unknown source: {source!r}")
+        if parser_engine not in PARSER_ENGINES:
+            raise ValueError(f"Unknown parser engine: {parser_engine!r}")
+        self._atom_source = PARSER_ENGINES[parser_engine]
+        self._source: FeedSource | None = (
+            self._atom_source if source == "atom" else SOURCES.get(source)
+        )
+        self._fetch_url = feed_url
+        self._body_digest: bytes | None = None  # blake2b of the last body parsed
+
+        # Whether the initial (show-everything) fetch has happened
+        self._polled = False
+
+        # Graceful shutdown
+        self._running = False
+
+    async def start(self) -> None:
+        """Begin the async monitoring loop."""
+        self._running = True
+        logger.info(
+            ">> Starting monitor for '%s' (feed: %s, interval: %ds)",
+            self.name,
+            self.feed_url,
+            self.poll_interval,
+        )
+
+        if self._session is not None:
+            await self._poll_loop(self._session)
+        else:
+            async with create_session() as session:
+                await self._poll_loop(session)
+
+        logger.info("-- Monitor for '%s' stopped.", self.name)
+
+    async def _poll_loop(self, session: aiohttp.ClientSession) -> None:
+        """Run the initial fetch, then conditional fetches until stopped."""
+        # Initial fetch — show all current incidents
+        await self.poll(session)
+
+        while self._running:
+            await asyncio.sleep(self.current_interval)
+            if not self._running:
+                break
+            await self.poll(session)
+
+    async def poll(self, session: aiohttp.ClientSession) -> None:
+        """Run a single fetch cycle; the first one reports every incident."""
+        if self._dispatcher is not None:
+            # Backpressure: don't fetch more while the sinks are behind
+            await self._dispatcher.wait_for_capacity()
+        if self._source is None:
+            await self._detect_source(session)
+        if not self._polled:
+            self._restore_state()
+        initial = not self._polled
+        self._polled = True
+        await self._check_feed(session, initial=initial)
+
+    async def _detect_source(self, session: aiohttp.ClientSession) -> None:
+        """Prefer the page's JSON API when it answers; otherwise use Atom."""
+        url = _json_api_url(self.feed_url)
+        try:
+            async with session.get(
+                url,
+                headers={"Accept-Encoding": ACCEPT_ENCODING},
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as resp:
+                if resp.status == 200:
+                    decoder = BodyDecoder(
+                        resp.headers.get("Content-Encoding"),
+                        raw=not getattr(session, "auto_decompress", True),
+                    )
+                    JSON_SOURCE.parse(await decoder.read(resp))
+                    self._source = JSON_SOURCE
+                    self._fetch_url = url
+        except (aiohttp.ClientError, asyncio.TimeoutError, MalformedFeedError):
+            pass
+
+        if self._source is None:
+            self._source = self._atom_source
+        logger.info(
+            "Using %s source for '%s' (%s).",
+            self._source.name,
+            self.name,
+            self._fetch_url,
+        )
+
+    @property
+    def _streams(self) -> bool:
+        """Whether fetches are parsed incrementally (Atom only)."""
+        return self.streaming and isinstance(self._source, AtomSource)
+
+    def _restore_state(self) -> None:
+        """Load persisted state; a restored feed skips the initial report."""
+        state = self._state_store.load(self.feed_url)
+        if state is None:
+            return
+        self._etag = state.etag
+        self._last_modified = state.last_modified
+        self._seen_incidents = state.seen
+        self._polled = bool(state.seen)
+        logger.info(
+            "Restored state for '%s' (%d known incidents).",
+            self.name,
+            len(state.seen),
+        )
+
+    def inherit_state(self, other: "StatusPageMonitor") -> None:
+        """
+        Continue from ``other``'s polling state.
+
+        Used when a monitor is rebuilt with new settings for the same feed:
+        validators, seen state and the incident index are taken over (and
+        shared with any poll ``other`` still has in flight), so the first
+        poll is an ordinary conditional one rather than an initial report.
+        """
+        self._etag = other._etag
+        self._last_modified = other._last_modified
+        self._seen_incidents = other._seen_incidents
+        self._incidents = other._incidents
+        self._active_incidents = other._active_incidents
+        self._newest_seen = other._newest_seen
+        self._body_digest = other._body_digest
+        self._source = other._source
+        self._fetch_url = other._fetch_url
+        self._polled = other._polled
+
+    def stop(self) -> None:
+        """Signal the monitor to stop after the current cycle."""
+        self._running = False
+        self.flush_updates()
+
+    def current_incidents(self) -> list[IncidentUpdate]:
+        """
+        Latest known state of the feed's incidents, without fetching.
+
+        After a restore from a state store, only incidents that changed
+        since the restart are available here.
+        """
+        return list(self._incidents.values())
+
+    def get_incident(self, incident_id: str) -> IncidentUpdate | None:
+        return self._incidents.get(incident_id)
+
+    @property
+    def current_interval(self) -> float:
+        """
+        Seconds until the next poll is due.
+
+        At least any Retry-After, and no earlier than the last response
+        stays fresh.
+        """
+        interval = self._interval if self.adaptive else self.poll_interval
+        return max(interval, self._retry_after, self.fresh_for)
+
+    @property
+    def fresh_for(self) -> float:
+        """Seconds the last response remains fresh (0 once stale)."""
+        return max(self._fresh_until - time.monotonic(), 0.0)
+
+    def _update_freshness(self, resp) -> None:
+        """Record the freshness lifetime of a 200 / 304 response."""
+        lifetime = _freshness_lifetime(resp.headers) if self.max_freshness else None
+        if lifetime:
+            self._fresh_until = time.monotonic() + min(lifetime, self.max_freshness)
+        else:
+            self._fresh_until = 0.0
+
+    def _remember_redirect(self, resp) -> None:
+        """Fetch the target of a purely permanent redirect chain directly."""
+        history = getattr(resp, "history", ())
+        if history and all(r.status in PERMANENT_REDIRECTS for r in history):
+            target = str(resp.url)
+            if target != self._fetch_url:
+                logger.info(
+                    "'%s' moved permanently to %s; fetching it directly.",
+                    self.name,
+                    target,
+                )
+                self._fetch_url = target
+
+    def _record_poll(self, changes: int) -> None:
+        """Adjust the adaptive interval after a successful fetch cycle."""
+        if changes or self._active_incidents:
+            self._interval = self.min_interval
+            self._quiet_polls = 0
+            return
+
+        self._quiet_polls += 1
+        if self._quiet_polls >= ADAPTIVE_BACKOFF_AFTER:
+            self._quiet_polls = 0
+            self._interval = min(
+                self._interval * ADAPTIVE_BACKOFF_FACTOR, self.max_interval
+            )
+
+    async def _check_feed(
+        self, session: aiohttp.ClientSession, initial: bool = False
+    ) -> None:
+        """
+        Fetch the feed (conditionally) and process any new incidents.
+
+        Transient failures (network errors, timeouts, 5xx) are retried a few
+        times with jittered exponential backoff.  If the host keeps failing,
+        its circuit breaker opens and fetches are skipped until it cools down.
+        """
+        self._retry_after = 0.0
+        if self.fresh_for:
+            logger.debug("'%s' is still fresh; skipping fetch.", self.name)
+            metrics.inc("status_tracker_cache_fresh_total", feed=self.name)
+            return
+
+        breaker = self._breakers.setdefault(
+            urlsplit(self._fetch_url).netloc, CircuitBreaker()
+        )
+        if not breaker.allow():
+            logger.debug("Circuit open for '%s'; skipping fetch.", self.name)
+            metrics.inc("status_tracker_circuit_open_total", feed=self.name)
+            return
+
+        try:
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    delay = _retry_delay(attempt)
+                    logger.info(
+                        "Retrying '%s' in %.1fs (attempt %d of %d).",
+                        self.name,
+                        delay,
+                        attempt + 1,
+                        self.max_retries + 1,
+                    )
+                    metrics.inc("status_tracker_retries_total", feed=self.name)
+                    await asyncio.sleep(delay)
+                result = await self._fetch(session, initial)
+                if result is not _TRANSIENT:
+                    break
+        except BaseException:
+            # Whatever escaped, settle the attempt: a half-open trial that is
+            # never recorded would keep the host's circuit shut for good
+            breaker.record_failure()
+            raise
+        if result is _TRANSIENT:
+            breaker.record_failure()
+            return
+
+        breaker.record_success()
+        if result is None:
+            return
+
+        # Parse
+        fetched = time.perf_counter()
+        if self._streams:
+            changes = self._process_entries(result.entries, initial, result.complete)
+        elif (digest := self._new_body_digest(result.body)) is None:
+            changes = 0
+        else:
+            try:
+                scanned = await self._parse_body(result.body, initial)
+            except MalformedFeedError as exc:
+                logger.warning("Malformed feed from '%s': %s", self.name, exc)
+                metrics.inc("status_tracker_errors_total", feed=self.name)
+                return
+            parsed = time.perf_counter()
+            metrics.observe("status_tracker_parse_seconds", parsed - fetched)
+            changes = self._apply_scan(scanned, initial)
+            metrics.observe(
+                "status_tracker_process_seconds", time.perf_counter() - parsed
+            )
+            # Only a fully processed body may short-circuit later polls
+            self._body_digest = digest
+        self._record_poll(changes)
+
+        # Persist validators only once the body has been processed
+        self._state_store.save_validators(
+            self.feed_url, self._etag, self._last_modified
+        )
+
+    def _new_body_digest(self, body: bytes) -> bytes | None:
+        """
+        Digest of ``body``, or None if it matches the last body processed.
+
+        Covers servers that ignore validators or rotate ETags: a repeat of
+        the same document costs one hash instead of a parse and a diff.
+        """
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        if digest == self._body_digest:
+            logger.debug("Body unchanged for '%s'; skipping parse.", self.name)
+            metrics.inc("status_tracker_body_unchanged_total", feed=self.name)
+            return None
+        return digest
+
+    async def _fetch(
+        self, session: aiohttp.ClientSession, initial: bool
+    ) -> "_Fetched | None | object":
+        """
+        Make one conditional request.
+
+        Returns the fetched payload, None when there is nothing to process
+        (304, non-retryable status, Retry-After, malformed body), or
+        _TRANSIENT when the attempt may be retried.
+        """
+        headers = {"Accept-Encoding": ACCEPT_ENCODING}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+
+        metrics.inc("status_tracker_requests_total", feed=self.name)
+        started = time.perf_counter()
+        try:
+            async with session.get(
+                self._fetch_url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as resp:
+                metrics.inc(
+                    "status_tracker_responses_total",
+                    feed=self.name,
+                    status=str(resp.status),
+                )
+                self._remember_redirect(resp)
+                if resp.status in (200, 304):
+                    self._update_freshness(resp)
+
+                if resp.status == 304:
+                    logger.debug(
+                        "No changes for '%s' (304 Not Modified).", self.name
+                    )
+                    metrics.observe(
+                        "status_tracker_fetch_seconds", time.perf_counter() - started
+                    )
+                    self._record_poll(0)
+                    return None
+
+                if resp.status in (429, 503):
+                    retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+                    if retry_after is not None:
+                        logger.warning(
+                            "'%s' returned %d; retrying after %.0fs.",
+                            self.name,
+                            resp.status,
+                            retry_after,
+                        )
+                        self._retry_after = retry_after
+                        return None
+
+                if resp.status == 429 or resp.status >= 500:
+                    logger.warning(
+                        "Transient status %d from '%s'.", resp.status, self.name
+                    )
+                    return _TRANSIENT
+
+                if resp.status != 200:
+                    logger.warning(
+                        "Unexpected status %d from '%s'.", resp.status, self.name
+                    )
+                    return None
+
+                # Update conditional-request tokens
+                self._etag = resp.headers.get("ETag")
+                self._last_modified = resp.headers.get("Last-Modified")
+
+                decoder = BodyDecoder(
+                    resp.headers.get("Content-Encoding"),
+                    raw=not getattr(session, "auto_decompress", True),
+                )
+                try:
+                    if self._streams:
+                        entries, complete = await self._stream_entries(
+                            resp, initial, decoder
+                        )
+                        fetched = _Fetched(entries=entries, complete=complete)
+                    else:
+                        # Raw bytes: the parser honours the declared encoding
+                        fetched = _Fetched(body=await decoder.read(resp))
+                finally:
+                    self._record_bytes(decoder)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            logger.error("Network error for '%s': %s", self.name, exc)
+            metrics.inc("status_tracker_errors_total", feed=self.name)
+            return _TRANSIENT
+        except (ET.ParseError, MalformedFeedError) as exc:
+            logger.warning("Malformed feed from '%s': %s", self.name, exc)
+            metrics.inc("status_tracker_errors_total", feed=self.name)
+            return None
+
+        metrics.observe("status_tracker_fetch_seconds", time.perf_counter() - started)
+        return fetched
+
+    def _record_bytes(self, decoder: BodyDecoder) -> None:
+        """Count wire (compressed) and decoded body sizes for this feed."""
+        if decoder.wire_bytes is not None:
+            metrics.inc(
+                "status_tracker_response_bytes_total",
+                decoder.wire_bytes,
+                feed=self.name,
+            )
+        metrics.inc(
+            "status_tracker_decoded_bytes_total",
+            decoder.decoded_bytes,
+            feed=self.name,
+        )
+
+    async def _stream_entries(
+        self, resp: aiohttp.ClientResponse, initial: bool, decoder: BodyDecoder
+    ) -> tuple[list[FeedEntry], bool]:
+        """
+        Parse the response body incrementally as chunks arrive.
+
+        Atom feeds list the most recently updated entries first, so once an
+        entry is older than the newest timestamp already seen, everything
+        after it is known and the rest of the body is not read (nor
+        decompressed).  Returns the entries read and whether the whole feed
+        was consumed.
+        """
+        parser = AtomStreamParser()
+        entries: list[FeedEntry] = []
+        watermark = None if initial else self._newest_seen
+
+        def accept(batch: list[FeedEntry]) -> bool:
+            for entry in batch:
+                updated = _entry_key(entry)
+                if watermark is not None and 0 < updated < watermark:
+                    return False
+                entries.append(entry)
+            return True
+
+        async for chunk in decoder.iter_decoded(resp):
+            if not accept(parser.feed(chunk)):
+                return entries, False
+        return entries, accept(parser.close())
+
+    def _notify(self, incident: IncidentUpdate) -> None:
+        """Emit an incident, holding it first if coalescing is enabled."""
+        if not self.coalesce_window:
+            self._deliver(incident)
+            return
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        pending = self._pending_updates.get(incident.id)
+        if pending is None:
+            handle = loop.call_later(
+                self.coalesce_window, self._flush_update, incident.id
+            )
+            self._pending_updates[incident.id] = _PendingUpdate(
+                incident, now + self.coalesce_max_delay, handle
+            )
+            return
+
+        # A newer update replaces the held one; the window restarts but never
+        # extends past the deadline set by the first update of the burst.
+        pending.incident = incident
+        pending.handle.cancel()
+        delay = max(0.0, min(self.coalesce_window, pending.deadline - now))
+        pending.handle = loop.call_later(delay, self._flush_update, incident.id)
+
+    def _flush_update(self, incident_id: str) -> None:
+        pending = self._pending_updates.pop(incident_id, None)
+        if pending is not None:
+            self._deliver(pending.incident)
+
+    def flush_updates(self) -> None:
+        """Emit every held update now (used on shutdown)."""
+        for incident_id, pending in list(self._pending_updates.items()):
+            pending.handle.cancel()
+            self._flush_update(incident_id)
+
+    def _deliver(self, incident: IncidentUpdate) -> None:
+        """Hand an incident to the callback without blocking the loop on it."""
+        if self._dispatcher is not None:
+            self._dispatcher.submit(self.callback, self.name, incident)
+            return
+
+        started = time.perf_counter()
+        result = self.callback(self.name, incident)
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(
+                self._await_callback(result, incident, started)
+            )
+            self._callback_tasks.add(task)
+            task.add_done_callback(self._callback_tasks.discard)
+        else:
+            metrics.observe(
+                "status_tracker_callback_seconds", time.perf_counter() - started
+            )
+
+    async def _await_callback(
+        self, result: Awaitable[None], incident: IncidentUpdate, started: float
+    ) -> None:
+        try:
+            await result
+        except Exception:
+            logger.exception("Callback failed for '%s' (%s).", self.name, incident.id)
+        finally:
+            metrics.observe(
+                "status_tracker_callback_seconds", time.perf_counter() - started
+            )
+
+    async def _parse_body(self, body: bytes, initial: bool) -> list[ScannedEntry]:
+        """Parse and scan a buffered body, off-loop when an executor is set."""
+        if self._parse_executor is None:
+            return parse_feed_body(body, self._seen_incidents, initial, self._source)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._parse_executor,
+            parse_feed_body,
+            body,
+            self._seen_incidents,
+            initial,
+            self._source,
+        )
+
+    def _process_entries(
+        self, entries: list, initial: bool, complete: bool = True
+    ) -> int:
+        """
+        Detect new/updated incidents and fire callbacks.
+
+        ``complete`` is False when a streamed parse stopped early; incidents
+        not in ``entries`` are then kept as-is instead of being forgotten.
+
+        Returns the number of new or updated incidents (0 on the initial run).
+        """
+        scanned = scan_entries(entries, self._seen_incidents, initial)
+        return self._apply_scan(scanned, initial, complete)
+
+    def _apply_scan(
+        self, scanned: list[ScannedEntry], initial: bool, complete: bool = True
+    ) -> int:
+        """
+        Fold scan results into seen state and fire callbacks.
+
+        Seen state and the incident index are updated in place: only new or
+        changed entries touch them, and entries missing from a complete
+        scan are dropped.  An entry is marked seen only once its callback
+        has returned, so an event whose callback raised is retried on the
+        next poll; whatever was marked is persisted either way.
+        """
+        seen = self._seen_incidents
+        present: set[str] = set()
+        changed: dict[str, int] = {}
+        removed: list[str] = []
+        changes = 0
+
+        try:
+            for incident_id, updated_key, fingerprint, incident in scanned:
+                present.add(incident_id)
+
+                if updated_key and (
+                    self._newest_seen is None or updated_key > self._newest_seen
+                ):
+                    self._newest_seen = updated_key
+
+                if incident is None:
+                    continue
+
+                # The index holds its own copy: the parsed object is handed
+                # to callbacks and must not change under events already emitted
+                indexed = self._incidents.get(incident_id)
+                if indexed is None:
+                    self._incidents[incident_id] = incident.copy()
+                else:
+                    indexed.update_from(incident)
+
+                if incident.status.lower() in UNRESOLVED_STATUSES:
+                    self._active_incidents.add(incident_id)
+                else:
+                    self._active_incidents.discard(incident_id)
+
+                prev = seen.get(incident_id)
+                if initial:
+                    # On initial run, show all incidents to give immediate context
+                    self._notify(incident)
+                elif prev != UNKNOWN_FINGERPRINT:
+                    # Migrated state learns the fingerprint without reporting;
+                    # otherwise only fire if this is new or updated
+                    if prev is None:
+                        logger.info("[NEW] Incident detected: %s", incident.title)
+                    else:
+                        logger.info("[UPDATED] Incident updated: %s", incident.title)
+                    self._notify(incident)
+                    changes += 1
+
+                if prev != fingerprint:
+                    seen[incident_id] = fingerprint
+                    changed[incident_id] = fingerprint
+
+            if complete:
+                removed = [iid for iid in seen if iid not in present]
+                for iid in removed:
+                    del seen[iid]
+                    self._incidents.pop(iid, None)
+                self._active_incidents.difference_update(removed)
+        finally:
+            self._state_store.save_incidents(self.feed_url, changed, removed)
+        return changes
+
+
+# ---------------------------------------------------------------------------
+# Central poll scheduler
+# ---------------------------------------------------------------------------
+MAX_IN_FLIGHT = 50  # global cap on concurrent feed fetches
+SCHEDULE_JITTER = 0.1  # +/- fraction of the poll interval
+
+
+class PollScheduler:
+    """
+    Drives any number of monitors from a single task.
+
+    Monitors sit in a heap keyed by their next-due time.  First polls are
+    spread uniformly across each monitor's interval and every reschedule
+    gets a little jitter, so a fleet never fetches in one burst.  A
+    semaphore caps the number of fetches in flight at any time.
+
+    By default run() returns once no monitors remain; pass
+    ``exit_when_idle=False`` for fleets that may add monitors later.
+
+    Metrics:
+      - ``queue_depth``: monitors that are due but waiting for a free slot
+      - ``in_flight``:   fetches currently running
+      - ``last_lag`` / ``max_lag``: seconds between a monitor's due time
+        and the moment its fetch actually started
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        jitter: float = SCHEDULE_JITTER,
+        exit_when_idle: bool = True,
+    ):
+        self._session = session
+        self._jitter = jitter
+        self._exit_when_idle = exit_when_idle
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._heap: list[tuple[float, int, StatusPageMonitor]] = []
+        self._seq = itertools.count()
+        self._tasks: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._running = False
+
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    # -- metrics ------------------------------------------------------------
+    @property
+    def scheduled(self) -> int:
+        """Number of monitors waiting in the heap."""
+        return len(self._heap)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def queue_depth(self) -> int:
+        now = asyncio.get_running_loop().time()
+        return sum(1 for due, _, _ in self._heap if due <= now)
+
+    # -- scheduling -----------------------------------------------------------
+    def add(self, monitor: StatusPageMonitor, delay: float | None = None) -> None:
+        """
+        Schedule a monitor.  Without an explicit delay its first poll lands
+        at a random point within one poll interval.
+        """
+        if delay is None:
+            delay = random.uniform(0, monitor.poll_interval)
+        monitor._running = True
+        logger.info(
+            ">> Scheduling monitor for '%s' (feed: %s, interval: %ds)",
+            monitor.name,
+            monitor.feed_url,
+            monitor.poll_interval,
+        )
+        self._push(monitor, delay)
+
+    def _push(self, monitor: StatusPageMonitor, delay: float) -> None:
+        due = asyncio.get_running_loop().time() + delay
+        heapq.heappush(self._heap, (due, next(self._seq), monitor))
+        self._wakeup.set()
+
+    def _next_delay(self, monitor: StatusPageMonitor) -> float:
+        interval = monitor.current_interval
+        spread = interval * self._jitter
+        # Jitter never pulls a poll in before a Retry-After has passed or
+        # before the feed goes stale
+        floor = max(monitor._retry_after, monitor.fresh_for)
+        return max(interval + random.uniform(-spread, spread), floor)
+
+    async def run(self) -> None:
+        """Dispatch due polls until stop() is called or no monitors remain."""
+        loop = asyncio.get_running_loop()
+        self._running = True
+
+        while self._running:
+            if not self._heap:
+                if not self._tasks and self._exit_when_idle:
+                    break
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            due = self._heap[0][0]
+            delay = due - loop.time()
+            if delay > 0:
+                # Sleep until the next poll is due, or until a new monitor
+                # (possibly due earlier) is added.
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            due, _, monitor = heapq.heappop(self._heap)
+            if not monitor._running:
+                logger.info("-- Monitor for '%s' stopped.", monitor.name)
+                continue
+
+            await self._slots.acquire()
+            if not self._running:
+                self._slots.release()
+                break
+
+            lag = loop.time() - due
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+
+            self._tasks.add(asyncio.create_task(self._poll(monitor)))
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _poll(self, monitor: StatusPageMonitor) -> None:
+        try:
+            await monitor.poll(monitor._session or self._session)
+        except Exception:
+            logger.exception("Unhandled error polling '%s'.", monitor.name)
+        finally:
+            self._slots.release()
+            self._tasks.discard(asyncio.current_task())
+            if self._running and monitor._running:
+                self._push(monitor, self._next_delay(monitor))
+            self._wakeup.set()
+
+    def stop(self) -> None:
+        """Stop dispatching; in-flight fetches are allowed to finish."""
+        self._running = False
+        self._wakeup.set()
+
+
+# ---------------------------------------------------------------------------
+# Event-loop lag
+# ---------------------------------------------------------------------------
+LOOP_LAG_INTERVAL = 0.5  # seconds between probes
+LOOP_LAG_WARN = 0.25  # seconds of lag worth a warning
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop runs scheduled callbacks.
+
+    A probe sleeps for a fixed interval and records how much longer than
+    that it actually took to wake up.  Sustained lag means something (for
+    example feed parsing) is blocking the loop.
+    """
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL):
+        self.interval = interval
+        self.last = 0.0
+        self.max = 0.0
+        self.total = 0.0
+        self.samples = 0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.samples if self.samples else 0.0
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def record(self, lag: float) -> None:
+        self.last = lag
+        self.max = max(self.max, lag)
+        self.total += lag
+        self.samples += 1
+        metrics.observe("status_tracker_event_loop_lag_seconds", lag)
+        if lag >= LOOP_LAG_WARN:
+            logger.warning("Event loop lagged %.3fs behind schedule.", lag)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - expected))
+
+
+# ---------------------------------------------------------------------------
+# Multi-page runner
+# ---------------------------------------------------------------------------
+async def run_monitors(
+    monitors: list[StatusPageMonitor],
+    max_in_flight: int = MAX_IN_FLIGHT,
+    parse_executor: concurrent.futures.Executor | None = None,
+    dispatcher: CallbackDispatcher | None = None,
+    fleet: "Fleet | None" = None,
+    metrics_port: int | None = None,
+    http2: bool = False,
+) -> None:
+    """
+    Run multiple status page monitors concurrently.
+
+    A single PollScheduler task drives every monitor.  All monitors without
+    a session of their own share one pooled ClientSession, which is closed
+    once the scheduler has stopped.  Likewise, ``parse_executor`` (if given)
+    is injected into monitors that have none; the caller owns its shutdown.
+    A ``dispatcher`` is injected the same way, started here and drained
+    before returning.  Event-loop lag is sampled throughout and summarised on exit.
+
+    With a ``fleet``, monitors it adds on hot reload are injected and
+    scheduled the same way, and the runner keeps going even if the fleet
+    becomes empty.
+
+    With ``metrics_port`` set, Prometheus-style metrics are served on
+    http://127.0.0.1:<port>/metrics for the lifetime of the runner.
+
+    With ``http2`` the shared session is an Http2Session, so concurrent
+    polls of feeds on the same origin are multiplexed over one connection.
+    """
+    # Handle graceful shutdown on SIGINT / SIGTERM
+    loop = asyncio.get_running_loop()
+
+    scheduler: PollScheduler | None = None
+
+    def _shutdown():
+        logger.info("Shutdown signal received — stopping all monitors…")
+        for m in monitors:
+            m.stop()
+        if scheduler is not None:
+            scheduler.stop()
+        if fleet is not None:
+            fleet.stop()
+
+    # Register signal handlers (Unix-only; on Windows we rely on KeyboardInterrupt)
+    if sys.platform != "win32":
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, _shutdown)
+
+    async with open_session(http2) as session:
+        scheduler = PollScheduler(
+            session, max_in_flight=max_in_flight, exit_when_idle=fleet is None
+        )
+
+        def adopt(m: StatusPageMonitor) -> None:
+            if m._session is None:
+                m._session = session
+            if m._parse_executor is None:
+                m._parse_executor = parse_executor
+            if m._dispatcher is None:
+                m._dispatcher = dispatcher
+            scheduler.add(m)
+
+        for m in monitors:
+            adopt(m)
+        if fleet is not None:
+            fleet.attach(adopt)
+
+        if dispatcher is not None:
+            dispatcher.start()
+
+        loop_lag = LoopLagMonitor()
+        loop_lag.start()
+
+        gauges: dict[str, Callable[[], float]] = {
+            "status_tracker_scheduler_queue_depth": lambda: scheduler.queue_depth,
+            "status_tracker_scheduler_in_flight": lambda: scheduler.in_flight,
+            "status_tracker_scheduler_monitors": lambda: scheduler.scheduled,
+            "status_tracker_scheduler_lag_seconds": lambda: scheduler.last_lag,
+            "status_tracker_scheduler_max_lag_seconds": lambda: scheduler.max_lag,
+            "status_tracker_event_loop_max_lag_seconds": lambda: loop_lag.max,
+        }
+        if dispatcher is not None:
+            gauges["status_tracker_dispatch_queue_depth"] = lambda: dispatcher.depth
+        for name, fn in gauges.items():
+            metrics.gauge(name, fn)
+
+        metrics_runner = None
+        if metrics_port is not None:
+            metrics_runner = await start_metrics_server(port=metrics_port)
+
+        try:
+            await scheduler.run()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop_lag.stop()
+            if metrics_runner is not None:
+                await metrics_runner.cleanup()
+            for name in gauges:
+                metrics.remove_gauge(name)
+            if fleet is not None:
+                fleet.stop()
+            for m in monitors:
+                m.flush_updates()
+            if fleet is not None:
+                for m in fleet.monitors.values():
+                    m.flush_updates()
+            if dispatcher is not None:
+                await dispatcher.close()
+            logger.info(
+                "Event loop lag: mean %.1fms, max %.1fms over %d samples.",
+                loop_lag.mean * 1000,
+                loop_lag.max * 1000,
+                loop_lag.samples,
+            )
+
+
+# ---------------------------------------------------------------------------
+# Fleet configuration
+# ---------------------------------------------------------------------------
+FLEET_RELOAD_INTERVAL = 5.0  # seconds between config-file mtime checks
+
+
+def log_incident(page_name: str, incident: IncidentUpdate) -> None:
+    """Sink that writes one log line per incident update."""
+    logger.info(
+        "[%s] %s — %s: %s",
+        page_name,
+        incident.title,
+        incident.status,
+        incident.latest_message,
+    )
+
+
+# Named sinks usable from fleet config files
+SINKS: dict[str, IncidentCallback] = {
+    "console": on_incident_update,
+    "log": log_incident,
+}
+
+
+def register_sink(name: str, callback: IncidentCallback) -> None:
+    """Make ``callback`` available to fleet configs as ``name``."""
+    SINKS[name] = callback
+
+
+def _combine_sinks(names: list[str]) -> IncidentCallback:
+    """Return one callback fanning out to the named sinks."""
+    try:
+        callbacks = [SINKS[name] for name in names]
+    except KeyError as exc:
+        raise ValueError(f"Unknown sink: {exc.args[0]!r}") from None
+    if len(callbacks) == 1:
+        return callbacks[0]
+
+    def fan_out(page_name: str, incident: IncidentUpdate):
+        pending = [
+            result
+            for result in (cb(page_name, incident) for cb in callbacks)
+            if inspect.isawaitable(result)
+        ]
+        if pending:
+            return asyncio.gather(*pending)
+        return None
+
+    return fan_out
+
+
+class FeedConfig:
+    """One feed entry of a fleet config file."""
+
+    __slots__ = ("name", "feed_url", "poll_interval", "sinks", "options")
+
+    # Monitor keyword arguments a config entry may set directly, with the
+    # value types load_fleet_config accepts for each
+    OPTIONS: dict[str, tuple[type, ...]] = {
+        "adaptive": (bool,),
+        "min_interval": (int, float),
+        "max_interval": (int, float),
+        "streaming": (bool,),
+        "coalesce_window": (int, float, type(None)),
+        "coalesce_max_delay": (int, float, type(None)),
+        "source": (str,),
+        "parser_engine": (str,),
+        "max_freshness": (int, float),
+    }
+
+    def __init__(
+        self,
+        name: str,
+        feed_url: str,
+        poll_interval: float = 60,
+        sinks: list[str] | None = None,
+        options: dict | None = None,
+    ):
+        self.name = name
+        self.feed_url = feed_url
+        self.poll_interval = poll_interval
+        self.sinks = sinks or ["console"]
+        self.options = options or {}
+
+    def _key(self) -> tuple:
+        return (
+            self.name,
+            self.feed_url,
+            self.poll_interval,
+            tuple(self.sinks),
+            tuple(sorted(self.options.items())),
+        )
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, FeedConfig) and self._key() == other._key()
+
+    def same_feed(self, other: "FeedConfig | None") -> bool:
+        """Whether ``other`` polls the same feed the same way (state carries over)."""
+        return (
+            other is not None
+            and self.feed_url == other.feed_url
+            and all(
+                self.options.get(key) == other.options.get(key)
+                for key in ("source", "parser_engine")
+            )
+        )
+
+    def __repr__(self) -> str:
+        return f"FeedConfig(name={self.name!r}, feed_url={self.feed_url!r})"
+
+    def build(
+        self, callback: IncidentCallback | None = None, **kwargs
+    ) -> StatusPageMonitor:
+        """
+        Create a monitor for this feed (no network activity).
+
+        ``callback`` replaces the configured sinks, e.g. to forward events
+        out of a shard worker.
+        """
+        return StatusPageMonitor(
+            name=self.name,
+            feed_url=self.feed_url,
+            callback=callback or _combine_sinks(self.sinks),
+            poll_interval=self.poll_interval,
+            **self.options,
+            **kwargs,
+        )
+
+
+def _read_config_file(path: str) -> dict:
+    """Read a JSON, TOML or YAML document into a dict."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    if ext == ".toml":
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    if ext in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("YAML fleet configs require PyYAML") from None
+        with open(path, encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    raise ValueError(f"Unsupported fleet config format: {path}")
+
+
+def load_fleet_config(path: str) -> list[FeedConfig]:
+    """
+    Load feed definitions from a JSON, TOML or YAML file.
+
+    Layout (shown as TOML)::
+
+        [defaults]
+        interval = 60
+        sinks = ["console"]
+
+        [[feeds]]
+        name = "OpenAI API"
+        url = "https://status.openai.com/history.atom"
+        interval = 30            # optional, overrides defaults
+        sinks = ["console", "log"]
+        adaptive = true          # optional monitor options
+
+    Raises ValueError for missing fields, duplicate names, unknown sinks,
+    sources or parser engines, and option values of the wrong type.
+    """
+    doc = _read_config_file(path)
+    defaults = doc.get("defaults", {})
+    configs: list[FeedConfig] = []
+    names: set[str] = set()
+
+    for i, raw in enumerate(doc.get("feeds", [])):
+        item = {**defaults, **raw}
+        name, url = item.get("name"), item.get("url")
+        if not name or not url:
+            raise ValueError(f"Feed #{i} in {path} needs both 'name' and 'url'")
+        if name in names:
+            raise ValueError(f"Duplicate feed name in {path}: {name!r}")
+        names.add(name)
+
+        sinks = list(item.get("sinks", ["console"]))
+        for sink in sinks:
+            if sink not in SINKS:
+                raise ValueError(f"Unknown sink for feed {name!r}: {sink!r}")
+
+        interval = item.get("interval", 60)
+        _check_option(name, "interval", interval, (int, float))
+        options = {k: item[k] for k in FeedConfig.OPTIONS if k in item}
+        for key, value in options.items():
+            _check_option(name, key, value, FeedConfig.OPTIONS[key])
+        source = options.get("source", "atom")
+        if source != "auto" and source not in SOURCES:
+            raise ValueError(f"Unknown source for feed {name!r}: {source!r}")
+        engine = options.get("parser_engine", "feedparser")
+        if engine not in PARSER_ENGINES:
+            raise ValueError(f"Unknown parser engine for feed {name!r}: {engine!r}")
+
+        configs.append(
+            FeedConfig(
+                name=name,
+                feed_url=url,
+                poll_interval=interval,
+                sinks=sinks,
+                options=options,
+            )
+        )
+    return configs
+
+
+def _check_option(feed: str, key: str, value, types: tuple[type, ...]) -> None:
+    """Reject a config value of the wrong type (bools are not numbers here)."""
+    if not isinstance(value, types) or (
+        isinstance(value, bool) and bool not in types
+    ):
+        raise ValueError(
+            f"Feed {feed!r}: {key!r} must be "
+            f"{' or '.join(t.__name__ for t in types)}, not {value!r}"
+        )
+
+
+class Fleet:
+    """
+    Config-file driven set of monitors with hot reload.
+
+    Monitors are built without any network activity; the scheduler spreads
+    their first polls over each interval.  Once attached to a runner, the
+    file is checked for changes every ``reload_interval`` seconds and
+    monitors are added, replaced or stopped to match.  A config that fails
+    to load is logged and the running fleet is left untouched.
+
+    With ``shard=(index, count)`` only the feeds hashed to that shard are
+    run (see shard_of); ``callback_for`` builds each monitor's callback
+    from its config instead of the configured sinks.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        reload_interval: float = FLEET_RELOAD_INTERVAL,
+        shard: tuple[int, int] | None = None,
+        callback_for: Callable[[FeedConfig], IncidentCallback] | None = None,
+        **monitor_kwargs,
+    ):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.shard = shard
+        self._callback_for = callback_for
+        self._monitor_kwargs = monitor_kwargs
+        self._configs: dict[str, FeedConfig] = {}
+        self.monitors: dict[str, StatusPageMonitor] = {}
+        self._mtime: float | None = None
+        self._adopt: Callable[[StatusPageMonitor], None] | None = None
+        self._watch_task: asyncio.Task | None = None
+
+    def load(self) -> list[StatusPageMonitor]:
+        """Initial load; returns the monitors to run."""
+        self.reload()
+        return list(self.monitors.values())
+
+    def reload(self) -> tuple[int, int]:
+        """
+        Re-read the config and reconcile monitors.
+
+        Returns (started, stopped) counts; a changed feed counts as both.
+        Every new monitor is built before any running one is stopped, so a
+        config that fails to load or build leaves the fleet as it was (and
+        is retried on the next check).
+        """
+        mtime = os.stat(self.path).st_mtime
+        configs = {
+            c.name: c
+            for c in load_fleet_config(self.path)
+            if self.shard is None or shard_of(c.name, self.shard[1]) == self.shard[0]
+        }
+
+        built: dict[str, StatusPageMonitor] = {}
+        for name, config in configs.items():
+            if self._configs.get(name) == config:
+                continue
+            callback = self._callback_for(config) if self._callback_for else None
+            built[name] = config.build(callback, **self._monitor_kwargs)
+
+        stopped = 0
+        for name in list(self._configs):
+            if name in configs and name not in built:
+                continue
+            monitor = self.monitors.pop(name)
+            monitor.stop()
+            # A feed whose settings changed but which still polls the same
+            # URL keeps its validators and seen state, so it doesn't replay
+            if name in built and self._configs[name].same_feed(configs[name]):
+                built[name].inherit_state(monitor)
+            del self._configs[name]
+            stopped += 1
+
+        for name, monitor in built.items():
+            self._configs[name] = configs[name]
+            self.monitors[name] = monitor
+            if self._adopt is not None:
+                self._adopt(monitor)
+
+        self._mtime = mtime
+        return len(built), stopped
+
+    def attach(self, adopt: Callable[[StatusPageMonitor], None]) -> None:
+        """Hand future monitors to ``adopt`` and start watching the file."""
+        self._adopt = adopt
+        self._watch_task = asyncio.create_task(self._watch())
+
+    def stop(self) -> None:
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            self._watch_task = None
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                if os.stat(self.path).st_mtime == self._mtime:
+                    continue
+                started, stopped = self.reload()
+            except Exception as exc:
+                # Keep watching: the running fleet is untouched and a fixed
+                # file is picked up on a later check
+                logger.error("Fleet reload of %s failed: %s", self.path, exc)
+                continue
+            logger.info(
+                "Fleet reloaded from %s: %d started, %d stopped, %d total.",
+                self.path,
+                started,
+                stopped,
+                len(self.monitors),
+            )
+
+
+async def run_fleet(
+    path: str,
+    reload_interval: float = FLEET_RELOAD_INTERVAL,
+    state_db: str | None = None,
+    **run_kwargs,
+) -> None:
+    """
+    Run every feed in a fleet config file, hot-reloading it on change.
+
+    With ``state_db``, every monitor (including ones added on reload)
+    persists its validators and seen incidents in that SQLite file.
+    """
+    store = open_state_store(state_db)
+    try:
+        fleet = Fleet(path, reload_interval, state_store=store)
+        monitors = fleet.load()
+        logger.info("Loaded %d feed(s) from %s.", len(monitors), path)
+        await run_monitors(monitors, fleet=fleet, **run_kwargs)
+    finally:
+        store.close()
+
+
+# ---------------------------------------------------------------------------
+# Sharded multi-process runner
+# ---------------------------------------------------------------------------
+SHARD_EVENT_POLL = 0.5  # seconds between worker liveness checks while idle
+
+
+def shard_of(name: str, shards: int) -> int:
+    """
+    Shard index for a feed name.
+
+    Uses a stable digest rather than ``hash()``, which is
+    salted per process, so every worker agrees on the assignment and a
+    feed stays on the same shard across restarts and hot reloads.
+    """
+    digest = hashlib.blake2b(name.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+class _EventForwarder:
+    """Monitor callback in a shard worker: ship the event to the parent."""
+
+    __slots__ = ("_events", "_sinks")
+
+    def __init__(self, events, sinks: list[str]):
+        self._events = events
+        self._sinks = tuple(sinks)
+
+    def __call__(self, page_name: str, incident: IncidentUpdate) -> None:
+        self._events.put((page_name, self._sinks, incident))
+
+
+def _shard_worker(
+    index: int,
+    shards: int,
+    path: str,
+    reload_interval: float,
+    events,
+    run_kwargs: dict,
+    state_db: str | None = None,
+) -> None:
+    """Process entry point: run one shard of the fleet in its own loop."""
+    # A connection can't cross processes: each worker opens its own, and
+    # WAL mode lets the shards write their (disjoint) feeds side by side
+    store = open_state_store(state_db)
+    fleet = Fleet(
+        path,
+        reload_interval,
+        shard=(index, shards),
+        callback_for=lambda config: _EventForwarder(events, config.sinks),
+        state_store=store,
+    )
+    try:
+        monitors = fleet.load()
+        logger.info(
+            "Shard %d/%d running %d feed(s) (pid %d).",
+            index + 1,
+            shards,
+            len(monitors),
+            os.getpid(),
+        )
+        asyncio.run(run_monitors(monitors, fleet=fleet, **run_kwargs))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+        events.put(None)  # this shard is done
+
+
+class ShardedRunner:
+    """
+    Run a fleet config across worker processes, one shard each.
+
+    Feeds are assigned by shard_of(name), so each worker polls a stable
+    subset with its own event loop, connection pool and parse work, and
+    hot-reloads its share of the config.  Worker callbacks only forward
+    events; the parent delivers them one at a time, in arrival order, to
+    ``callback`` or else to each feed's configured sinks.
+
+    Workers shut down through run_monitors' own SIGINT/SIGTERM handling:
+    ``stop()`` (also called on SIGINT/SIGTERM in the parent) sends each
+    worker SIGTERM, and the runner returns once every worker has drained
+    its pending events and exited.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        shards: int | None = None,
+        reload_interval: float = FLEET_RELOAD_INTERVAL,
+        callback: IncidentCallback | None = None,
+        metrics_port: int | None = None,
+        state_db: str | None = None,
+        **run_kwargs,
+    ):
+        """
+        ``metrics_port``, if given, is the first of ``shards`` consecutive
+        ports: worker *i* serves its own metrics on ``metrics_port + i``.
+        ``state_db`` is a SQLite file that every worker keeps its feeds'
+        state in.  Other keyword arguments go to each worker's run_monitors.
+        """
+        self.path = path
+        self.shards = shards or os.cpu_count() or 1
+        self.reload_interval = reload_interval
+        self._callback = callback
+        self._metrics_port = metrics_port
+        self._state_db = state_db
+        self._run_kwargs = run_kwargs
+        self._sinks: dict[tuple[str, ...], IncidentCallback] = {}
+        self._processes: list = []
+        self.delivered = 0
+
+    def _deliver_to(self, sinks: tuple[str, ...]) -> IncidentCallback:
+        if self._callback is not None:
+            return self._callback
+        if sinks not in self._sinks:
+            self._sinks[sinks] = _combine_sinks(list(sinks))
+        return self._sinks[sinks]
+
+    def _start_workers(self, events) -> None:
+        ctx = multiprocessing.get_context("spawn")
+        for index in range(self.shards):
+            kwargs = dict(self._run_kwargs)
+            if self._metrics_port is not None:
+                kwargs["metrics_port"] = self._metrics_port + index
+            process = ctx.Process(
+                target=_shard_worker,
+                args=(
+                    index,
+                    self.shards,
+                    self.path,
+                    self.reload_interval,
+                    events,
+                    kwargs,
+                    self._state_db,
+                ),
+                name=f"status-tracker-shard-{index}",
+            )
+            process.start()
+            self._processes.append(process)
+
+    def stop(self) -> None:
+        """Ask every worker to shut down gracefully."""
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()  # SIGTERM -> run_monitors shutdown
+
+    async def run(self) -> None:
+        # Validate the config up front rather than in every worker
+        load_fleet_config(self.path)
+
+        loop = asyncio.get_running_loop()
+        if sys.platform != "win32":
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, self.stop)
+
+        events = multiprocessing.get_context("spawn").Queue()
+        self._start_workers(events)
+        logger.info("Started %d shard worker(s).", self.shards)
+
+        running = self.shards
+        try:
+            while running:
+                try:
+                    item = await loop.run_in_executor(
+                        None, events.get, True, SHARD_EVENT_POLL
+                    )
+                except queue.Empty:
+                    # A worker killed before its sentinel must not hang us
+                    if not any(p.is_alive() for p in self._processes):
+                        break
+                    continue
+                if item is None:
+                    running -= 1
+                    continue
+                page_name, sinks, incident = item
+                await _invoke_callback(self._deliver_to(sinks), page_name, incident)
+                self.delivered += 1
+        finally:
+            if sys.platform != "win32":
+                for sig in (signal.SIGINT, signal.SIGTERM):
+                    loop.remove_signal_handler(sig)
+            self.stop()
+            for process in self._processes:
+                await loop.run_in_executor(None, process.join)
+            events.close()
+            logger.info(
+                "All shards stopped; %d event(s) delivered.", self.delivered
+            )
+
+
+def run_sharded(path: str, shards: int | None = None, **kwargs) -> None:
+    """Run a fleet config file across ``shards`` worker processes."""
+    asyncio.run(ShardedRunner(path, shards, **kwargs).run())
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """Entry point — configure monitors and run."""
+    parser = argparse.ArgumentParser(description="Status page tracker")
+    parser.add_argument(
+        "--config",
+        help="fleet config file (JSON/TOML/YAML); hot-reloaded on change",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="serve Prometheus metrics on http://127.0.0.1:PORT/metrics",
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="fetch over HTTP/2, multiplexing feeds that share a host "
+        "(requires httpx[http2])",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="with --config: split feeds across N worker processes",
+    )
+    parser.add_argument(
+        "--state-db",
+        metavar="PATH",
+        help="keep ETags and seen incidents in this SQLite file across restarts",
+    )
+    args = parser.parse_args(argv)
+    run_kwargs = {
+        "metrics_port": args.metrics_port,
+        "http2": args.http2,
+        "state_db": args.state_db,
+    }
+    if args.shards > 1 and not args.config:
+        parser.error("--shards requires --config")
+
+    if args.config:
+        try:
+            if args.shards > 1:
+                run_sharded(args.config, args.shards, **run_kwargs)
+            else:
+                asyncio.run(run_fleet(args.config, **run_kwargs))
+        except KeyboardInterrupt:
+            logger.info("KeyboardInterrupt — shutting down.")
+        return
+
     print("+--------------------------------------------------------------+")
     print("|          OpenAI Status Page Tracker (Event-Driven)           |")
     print("|          Monitoring: https://status.openai.com/              |")
@@ -434,11 +3434,13 @@ def main() -> None:
     # You can add more monitors here to track additional status pages.
     # Each runs concurrently in the same asyncio event loop.
 
+    store = open_state_store(run_kwargs.pop("state_db"))
     monitors = [
         StatusPageMonitor(
             name="OpenAI API",
             feed_url="https://status.openai.com/history.atom",
             poll_interval=60,  # seconds between conditional checks
+            state_store=store,
         ),
         # ── Examples: add more providers ────────────────────────────────
         # StatusPageMonitor(
@@ -456,9 +3458,11 @@ def main() -> None:
     logger.info("Configured %d monitor(s). Starting…", len(monitors))
 
     try:
-        asyncio.run(run_monitors(monitors))
+        asyncio.run(run_monitors(monitors, **run_kwargs))
     except KeyboardInterrupt:
         logger.info("KeyboardInterrupt — shutting down.")
+    finally:
+        store.close()
 
 
 if __name__ == "__main__":
@@ -8,19 +8,56 @@ Tests cover:
 """
 
 import asyncio
+import concurrent.futures
+import gzip
+import json
+import queue
+import re
+import sqlite3
+import time
+import zlib
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 from calendar import timegm
 from time import struct_time
 
+import feedparser
+import aiohttp
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from status_tracker import (
+    _freshness_lifetime,
+    _shard_worker,
+    AtomStreamParser,
+    CallbackDispatcher,
+    CircuitBreaker,
+    Fleet,
+    Http2Session,
+    MetricsRegistry,
     IncidentUpdate,
+    JSON_SOURCE,
+    PARSER_ENGINES,
+    LoopLagMonitor,
+    MalformedFeedError,
+    PollScheduler,
+    SQLiteStateStore,
+    ShardedRunner,
     StatusPageMonitor,
+    create_parse_executor,
+    create_session,
+    load_fleet_config,
+    main,
+    metrics,
+    on_incident_update,
+    open_session,
+    parse_feed_body,
     parse_incident,
+    run_monitors,
+    shard_of,
+    start_metrics_server,
     strip_html,
-    on_incident_update,
 )
 
 
@@ -51,6 +88,32 @@ def _make_entry(
     return entry
 
 
+def _atom_feed(entries: list[tuple[str, str, str, str]]) -> bytes:
+    """Build an Atom document from (id, title, updated, html) tuples."""
+    from html import escape
+
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<feed xmlns="http://www.w3.org/2005/Atom"><title>Status</title>',
+    ]
+    for id, title, updated, html in entries:
+        parts.append(
+            f"<entry><id>{id}</id><title>{escape(title)}</title>"
+            f'<link rel="alternate" type="text/html" href="https://example.com/{id}"/>'
+            f"<updated>{updated}</updated>"
+            f'<content type="html">{escape(html)}</content></entry>'
+        )
+    parts.append("</feed>")
+    return "\n".join(parts).encode()
+
+
+def _serve(handler) -> TestServer:
+    """Local HTTP server answering every GET with ``handler``."""
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    return TestServer(app)
+
+
 # ---------------------------------------------------------------------------
 # Tests – HTML stripping
 # ---------------------------------------------------------------------------
@@ -144,6 +207,17 @@ class TestParseIncident:
         incident = parse_incident(entry)
         assert "recovered" in incident.latest_message.lower()
 
+    def test_html_stripped_once_per_entry(self):
+        entry = _make_entry(
+            summary="<p>We are investigating.</p>\n<p>- Login (Degraded)</p>",
+        )
+        with patch("status_tracker.strip_html", wraps=strip_html) as spy:
+            incident = parse_incident(entry)
+        assert spy.call_count == 1
+        assert incident.status == "Investigating"
+        assert incident.affected_components == ["Login (Degraded)"]
+        assert incident.latest_message == "We are investigating."
+
 
 # ---------------------------------------------------------------------------
 # Tests – StatusPageMonitor change detection
@@ -219,7 +293,7 @@ class TestChangeDetection:
         assert fired[0].title == "New Incident"
 
     def test_updated_incident_fires_callback(self):
-        """An incident with a changed timestamp should fire a callback."""
+        """An incident whose content changed should fire a callback."""
         fired = []
 
         def cb(name, incident):
@@ -245,12 +319,138 @@ class TestChangeDetection:
             _make_entry(
                 id="inc1",
                 title="Incident 1",
+                summary="A fix has been implemented.",
                 updated=(2025, 11, 3, 15, 0, 0, 0, 307, 0),  # 1 hour later
             )
         ]
         monitor._process_entries(entries_v2, initial=False)
         assert len(fired) == 1
 
+    def test_timestamp_only_bump_is_ignored(self):
+        """A newer timestamp with identical content is not an update."""
+        fired = []
+        monitor = StatusPageMonitor(
+            name="Test",
+            feed_url="http://example.com/feed.atom",
+            callback=lambda n, i: fired.append(i),
+        )
+        monitor._process_entries([_make_entry(id="inc1")], initial=True)
+        fired.clear()
+
+        bumped = _make_entry(id="inc1", updated=(2025, 11, 3, 15, 0, 0, 0, 307, 0))
+        monitor._process_entries([bumped], initial=False)
+        assert fired == []
+
+    def test_content_edit_without_timestamp_fires(self):
+        """Edited content, components or title count even at the same time."""
+        fired = []
+        monitor = StatusPageMonitor(
+            name="Test",
+            feed_url="http://example.com/feed.atom",
+            callback=lambda n, i: fired.append(i),
+        )
+        monitor._process_entries([_make_entry(id="inc1")], initial=True)
+        fired.clear()
+
+        summary, tags = "Resolved - all good.", [{"term": "API"}]
+        for edited in (
+            _make_entry(id="inc1", summary=summary),
+            _make_entry(id="inc1", summary=summary, tags=tags),
+            _make_entry(id="inc1", summary=summary, tags=tags, title="Renamed"),
+        ):
+            monitor._process_entries([edited], initial=False)
+        assert [i.title for i in fired] == ["Test Incident", "Test Incident", "Renamed"]
+        assert fired[1].affected_components == ["API"]
+
+    def test_unchanged_entries_skip_parsing(self):
+        """Entries whose id + content fingerprint are already seen are never parsed."""
+        monitor = StatusPageMonitor(
+            name="Test",
+            feed_url="http://example.com/feed.atom",
+            callback=lambda n, i: None,
+        )
+
+        entries = [
+            _make_entry(id="inc1", title="Incident 1"),
+            _make_entry(id="inc2", title="Incident 2"),
+        ]
+        monitor._process_entries(entries, initial=True)
+
+        entries.append(_make_entry(id="inc3", title="Incident 3"))
+        with patch(
+            "status_tracker.parse_incident", wraps=parse_incident
+        ) as spy:
+            monitor._process_entries(entries, initial=False)
+
+        assert spy.call_count == 1
+        assert set(monitor._seen_incidents) == {"inc1", "inc2", "inc3"}
+
+    def test_incident_index_updated_in_place(self):
+        monitor = StatusPageMonitor(
+            name="Test",
+            feed_url="http://example.com/feed.atom",
+            callback=lambda n, i: None,
+        )
+        monitor._process_entries(
+            [
+                _make_entry(id="inc1", summary="We are investigating."),
+                _make_entry(id="inc2", title="Incident 2"),
+            ],
+            initial=True,
+        )
+        first = monitor.get_incident("inc1")
+        untouched = monitor.get_incident("inc2")
+
+        monitor._process_entries(
+            [
+                _make_entry(
+                    id="inc1",
+                    summary="This incident has been resolved.",
+                    updated=(2025, 11, 3, 15, 0, 0, 0, 307, 0),
+                ),
+                _make_entry(id="inc2", title="Incident 2"),
+            ],
+            initial=False,
+        )
+        assert monitor.get_incident("inc1") is first
+        assert first.status == "Resolved"
+        assert monitor.get_incident("inc2") is untouched
+
+        monitor._process_entries([_make_entry(id="inc2")], initial=False)
+        assert [i.id for i in monitor.current_incidents()] == ["inc2"]
+        assert set(monitor._seen_incidents) == {"inc2"}
+
+    def test_category_label_change_fires(self):
+        """A status carried only in a category label is part of the content."""
+        fired = []
+        monitor = StatusPageMonitor(
+            name="Test",
+            feed_url="http://example.com/feed.atom",
+            callback=lambda n, i: fired.append(i.status),
+        )
+        tag = {"term": "status", "scheme": None, "label": "Investigating"}
+        monitor._process_entries([_make_entry(id="inc1", tags=[tag])], initial=True)
+        fired.clear()
+
+        resolved = _make_entry(
+            id="inc1",
+            tags=[{**tag, "label": "Resolved"}],
+            updated=(2025, 11, 3, 15, 0, 0, 0, 307, 0),
+        )
+        monitor._process_entries([resolved], initial=False)
+        assert fired == ["Resolved"]
+
+    def test_seen_state_holds_fingerprint_ints(self):
+        monitor = StatusPageMonitor(
+            name="Test",
+            feed_url="http://example.com/feed.atom",
+            callback=lambda n, i: None,
+        )
+        monitor._process_entries([_make_entry(id="inc1")], initial=True)
+        (fingerprint,) = monitor._seen_incidents.values()
+        assert isinstance(fingerprint, int)
+        assert -(2**63) <= fingerprint < 2**63
+
 
 # ---------------------------------------------------------------------------
 # Tests – Console output callback
@@ -299,3 +499,1619 @@ class TestMonitorInit:
             name="Test", feed_url="http://example.com/feed", callback=cb
         )
         assert m.callback is cb
+
+
+# ---------------------------------------------------------------------------
+# Tests – Adaptive poll interval
+# ---------------------------------------------------------------------------
+class TestAdaptiveInterval:
+    def _monitor(self, **kwargs):
+        return StatusPageMonitor(
+            name="Test",
+            feed_url="http://example.com/feed",
+            callback=lambda n, i: None,
+            adaptive=True,
+            min_interval=5,
+            max_interval=40,
+            **kwargs,
+        )
+
+    def test_fixed_interval_when_not_adaptive(self):
+        m = StatusPageMonitor(name="Test", feed_url="http://example.com/feed")
+        m._record_poll(3)
+        assert m.current_interval == 60
+
+    def test_backs_off_after_quiet_polls(self):
+        m = self._monitor(poll_interval=10)
+        intervals = []
+        for _ in range(9):
+            m._record_poll(0)
+            intervals.append(m.current_interval)
+        assert intervals == [10, 10, 20, 20, 20, 40, 40, 40, 40]
+
+    def test_change_drops_to_floor(self):
+        m = self._monitor(poll_interval=30)
+        m._record_poll(1)
+        assert m.current_interval == 5
+
+    def test_unresolved_incident_holds_floor(self):
+        m = self._monitor()
+        m._process_entries(
+            [_make_entry(id="inc1", summary="We are investigating.")],
+            initial=True,
+        )
+        for _ in range(5):
+            m._record_poll(0)
+        assert m.current_interval == 5
+
+        resolved = _make_entry(
+            id="inc1",
+            summary="This incident has been resolved.",
+            updated=(2025, 11, 3, 15, 0, 0, 0, 307, 0),
+        )
+        assert m._process_entries([resolved], initial=False) == 1
+        assert not m._active_incidents
+
+
+# ---------------------------------------------------------------------------
+# Tests – Persistent state
+# ---------------------------------------------------------------------------
+class TestStateStore:
+    def _run_once(self, store, entries, fired):
+        m = StatusPageMonitor(
+            name="Test",
+            feed_url="http://example.com/feed",
+            callback=lambda n, i: fired.append(i),
+            state_store=store,
+        )
+
+        async def fake_check(session, initial=False):
+            m._process_entries(entries, initial)
+
+        m._check_feed = fake_check
+        asyncio.run(m.poll(None))
+        return m
+
+    def test_restart_resumes_without_replaying_history(self, tmp_path):
+        path = str(tmp_path / "state.db")
+        entries = [
+            _make_entry(id="inc1", title="Incident 1"),
+            _make_entry(id="inc2", title="Incident 2"),
+        ]
+
+        fired = []
+        store = SQLiteStateStore(path)
+        self._run_once(store, entries, fired)
+        store.save_validators("http://example.com/feed", '"v1"', None)
+        store.close()
+        assert len(fired) == 2
+
+        fired.clear()
+        store = SQLiteStateStore(path)
+        entries = [entries[0], _make_entry(id="inc3", title="Incident 3")]
+        m = self._run_once(store, entries, fired)
+
+        assert [i.id for i in fired] == ["inc3"]
+        assert m._etag == '"v1"'
+        assert set(store.load("http://example.com/feed").seen) == {"inc1", "inc3"}
+        store.close()
+
+    def test_legacy_timestamp_rows_are_migrated(self, tmp_path):
+        path = str(tmp_path / "state.db")
+        db = sqlite3.connect(path)
+        db.execute(
+            "CREATE TABLE incidents (feed TEXT NOT NULL, incident_id TEXT NOT NULL, "
+            "updated INTEGER NOT NULL, PRIMARY KEY (feed, incident_id)) WITHOUT ROWID"
+        )
+        db.executemany(
+            "INSERT INTO incidents VALUES (?, ?, ?)",
+            [
+                ("http://example.com/feed", "inc1", "2025-11-03T14:32:00+00:00"),
+                ("http://example.com/feed", "inc2", 1762180320),
+            ],
+        )
+        db.commit()
+        db.close()
+
+        store = SQLiteStateStore(path)
+        assert store.load("http://example.com/feed").seen == {"inc1": 0, "inc2": 0}
+
+        # Known incidents are adopted silently; only the new one is reported
+        fired = []
+        entries = [_make_entry(id=i, title=i) for i in ("inc1", "inc2", "inc3")]
+        self._run_once(store, entries, fired)
+        assert [i.id for i in fired] == ["inc3"]
+        assert 0 not in store.load("http://example.com/feed").seen.values()
+        store.close()
+
+    def test_failed_callback_is_retried(self, tmp_path):
+        store = SQLiteStateStore(str(tmp_path / "state.db"))
+        attempts = []
+
+        def cb(name, incident):
+            attempts.append(incident.id)
+            if attempts.count("inc2") == 1:
+                raise RuntimeError("sink down")
+
+        m = StatusPageMonitor(
+            name="Test",
+            feed_url="http://example.com/feed",
+            callback=cb,
+            state_store=store,
+        )
+        inc1 = _make_entry(id="inc1", title="Incident 1")
+        inc2 = _make_entry(id="inc2", title="Incident 2")
+        m._process_entries([inc1], initial=True)
+
+        with pytest.raises(RuntimeError):
+            m._process_entries([inc2, inc1], initial=False)
+        # Neither memory nor the database may record the failed event as seen
+        assert "inc2" not in m._seen_incidents
+        assert set(store.load("http://example.com/feed").seen) == {"inc1"}
+
+        assert m._process_entries([inc2, inc1], initial=False) == 1
+        assert attempts == ["inc1", "inc2", "inc2"]
+        assert set(store.load("http://example.com/feed").seen) == {"inc1", "inc2"}
+        store.close()
+
+    def test_unknown_feed_loads_nothing(self, tmp_path):
+        store = SQLiteStateStore(str(tmp_path / "state.db"))
+        assert store.load("http://example.com/other") is None
+        store.close()
+
+    @pytest.mark.parametrize("sharded", [False, True])
+    def test_state_db_reaches_every_fleet_monitor(
+        self, tmp_path, monkeypatch, sharded
+    ):
+        config = tmp_path / "fleet.json"
+        feeds = [{"name": f"F{i}", "url": f"http://f{i}/feed"} for i in range(3)]
+        config.write_text(json.dumps({"feeds": feeds}))
+        db = str(tmp_path / "state.db")
+        stores = []
+
+        async def fake_run(monitors, **kwargs):
+            stores.extend(m._state_store for m in monitors)
+
+        monkeypatch.setattr("status_tracker.run_monitors", fake_run)
+        if sharded:
+            events = queue.Queue()
+            _shard_worker(0, 1, str(config), 1.0, events, {}, db)
+            assert events.get_nowait() is None
+        else:
+            main(["--config", str(config), "--state-db", db])
+
+        assert len(stores) == len(feeds)
+        assert all(s is stores[0] for s in stores)
+        assert isinstance(stores[0], SQLiteStateStore) and stores[0].path == db
+
+
+# ---------------------------------------------------------------------------
+# Tests – Shared connection pool
+# ---------------------------------------------------------------------------
+class TestSharedSession:
+    def test_create_session_tuning(self):
+        async def scenario():
+            async with create_session(limit=50, limit_per_host=4) as s:
+                return s.connector.limit, s.connector.limit_per_host
+
+        assert asyncio.run(scenario()) == (50, 4)
+
+    def test_run_monitors_injects_one_session(self):
+        sessions = []
+
+        def make_monitor(name):
+            m = StatusPageMonitor(
+                name=name, feed_url="http://example.com/feed", poll_interval=0.01
+            )
+
+            async def fake_check(session, initial=False):
+                sessions.append(session)
+                m.stop()
+
+            m._check_feed = fake_check
+            return m
+
+        monitors = [make_monitor("A"), make_monitor("B")]
+        asyncio.run(run_monitors(monitors))
+
+        assert len(sessions) == 2
+        assert sessions[0] is sessions[1]
+        assert sessions[0].closed
+
+
+# ---------------------------------------------------------------------------
+# Tests – Central poll scheduler
+# ---------------------------------------------------------------------------
+def _scheduled_monitor(name, interval, on_poll):
+    m = StatusPageMonitor(
+        name=name, feed_url="http://example.com/feed", poll_interval=interval
+    )
+
+    async def fake_check(session, initial=False):
+        await on_poll(m, initial)
+
+    m._check_feed = fake_check
+    return m
+
+
+class TestPollScheduler:
+    def test_first_polls_spread_across_interval(self):
+        starts = []
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            t0 = loop.time()
+            scheduler = PollScheduler(session=None)
+
+            async def on_poll(m, initial):
+                starts.append(loop.time() - t0)
+                m.stop()
+
+            for i in range(20):
+                scheduler.add(_scheduled_monitor(f"M{i}", 0.2, on_poll))
+            await scheduler.run()
+
+        asyncio.run(scenario())
+        assert len(starts) == 20
+        assert max(starts) < 0.3
+        # Not everything fires in the same instant
+        assert max(starts) - min(starts) > 0.05
+
+    def test_reschedules_and_marks_first_poll_initial(self):
+        polls = []
+
+        async def scenario():
+            scheduler = PollScheduler(session=None)
+
+            async def on_poll(m, initial):
+                polls.append(initial)
+                if len(polls) == 3:
+                    m.stop()
+
+            scheduler.add(_scheduled_monitor("M", 0.01, on_poll), delay=0)
+            await scheduler.run()
+
+        asyncio.run(scenario())
+        assert polls == [True, False, False]
+
+    def test_caps_in_flight_fetches(self):
+        active = 0
+        peak = 0
+        depths = []
+
+        async def scenario():
+            nonlocal active, peak
+            scheduler = PollScheduler(session=None, max_in_flight=2)
+
+            async def on_poll(m, initial):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                depths.append(scheduler.queue_depth)
+                await asyncio.sleep(0.02)
+                active -= 1
+                m.stop()
+
+            for i in range(6):
+                scheduler.add(_scheduled_monitor(f"M{i}", 1, on_poll), delay=0)
+            await scheduler.run()
+            return scheduler
+
+        scheduler = asyncio.run(scenario())
+        assert peak == 2
+        assert max(depths) > 0
+        assert scheduler.max_lag >= 0.02
+
+
+# ---------------------------------------------------------------------------
+# Tests – Streaming Atom parser
+# ---------------------------------------------------------------------------
+SAMPLE_ENTRIES = [
+    (
+        "inc3",
+        "API errors & timeouts",
+        "2025-11-03T15:00:00Z",
+        "<p>We are investigating.</p>\n<p>- API (Partial Outage)</p>",
+    ),
+    ("inc2", "Slow logins", "2025-11-03T14:00:00+00:00", "<p>Resolved.</p>"),
+    ("inc1", "Old incident", "2025-11-02T10:00:00.250Z", "<p>Resolved.</p>"),
+]
+SAMPLE_FEED = _atom_feed(SAMPLE_ENTRIES)
+
+
+def _fields(incident):
+    return (
+        incident.id,
+        incident.title,
+        incident.link,
+        incident.status,
+        incident.affected_components,
+        incident.latest_message,
+        incident.updated_at,
+    )
+
+
+class TestAtomStreamParser:
+    def test_chunked_parse_matches_feedparser(self):
+        parser = AtomStreamParser()
+        entries = []
+        for i in range(0, len(SAMPLE_FEED), 7):
+            entries.extend(parser.feed(SAMPLE_FEED[i : i + 7]))
+        entries.extend(parser.close())
+
+        expected = feedparser.parse(SAMPLE_FEED).entries
+        assert [_fields(parse_incident(e)) for e in entries] == [
+            _fields(parse_incident(e)) for e in expected
+        ]
+
+    def test_streaming_stops_at_seen_entries(self):
+        body = SAMPLE_FEED
+        fired = []
+        batches = []
+
+        async def handler(request):
+            return web.Response(body=body, content_type="application/atom+xml")
+
+        async def scenario():
+            nonlocal body
+            async with _serve(handler) as server:
+                m = StatusPageMonitor(
+                    name="Test",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: fired.append(i.id),
+                    streaming=True,
+                )
+                process = m._process_entries
+
+                def spy(entries, initial, complete=True):
+                    batches.append((len(entries), complete))
+                    return process(entries, initial, complete)
+
+                m._process_entries = spy
+                async with create_session() as session:
+                    await m.poll(session)
+                    new = ("inc4", "New", "2025-11-04T09:00:00Z", "<p>Investigating</p>")
+                    body = _atom_feed([new] + SAMPLE_ENTRIES)
+                    await m.poll(session)
+                return m
+
+        m = asyncio.run(scenario())
+        assert fired == ["inc3", "inc2", "inc1", "inc4"]
+        # Second poll reads inc4 and inc3, then stops at the older inc2
+        assert batches == [(3, True), (2, False)]
+        assert set(m._seen_incidents) == {"inc1", "inc2", "inc3", "inc4"}
+
+
+# ---------------------------------------------------------------------------
+# Tests – Off-loop parsing
+# ---------------------------------------------------------------------------
+class TestParseExecutor:
+    def _poll_twice(self, executor, bodies):
+        fired = []
+
+        async def handler(request):
+            return web.Response(
+                body=bodies.pop(0), content_type="application/atom+xml"
+            )
+
+        async def scenario():
+            async with _serve(handler) as server:
+                m = StatusPageMonitor(
+                    name="Test",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: fired.append(_fields(i)),
+                    parse_executor=executor,
+                )
+                async with create_session() as session:
+                    await m.poll(session)
+                    await m.poll(session)
+
+        asyncio.run(scenario())
+        return fired
+
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    def test_executor_matches_inline_parsing(self, mode):
+        new = ("inc4", "New", "2025-11-04T09:00:00Z", "<p>Investigating</p>")
+        bodies = [SAMPLE_FEED, _atom_feed([new] + SAMPLE_ENTRIES)]
+
+        inline = self._poll_twice(None, list(bodies))
+        with create_parse_executor(mode, workers=1) as executor:
+            offloaded = self._poll_twice(executor, list(bodies))
+
+        assert len(inline) == 4
+        assert offloaded == inline
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            create_parse_executor("fiber")
+
+
+class TestLoopLagMonitor:
+    def test_detects_blocked_loop(self):
+        async def scenario():
+            lag = LoopLagMonitor(interval=0.01)
+            lag.start()
+            await asyncio.sleep(0.02)
+            time.sleep(0.1)  # block the loop
+            await asyncio.sleep(0.02)
+            lag.stop()
+            return lag
+
+        lag = asyncio.run(scenario())
+        assert lag.samples >= 2
+        assert lag.max >= 0.05
+
+
+# ---------------------------------------------------------------------------
+# Tests – Callback dispatch
+# ---------------------------------------------------------------------------
+def _incident(id: str, message: str = "msg") -> IncidentUpdate:
+    return IncidentUpdate(
+        id=id,
+        title=f"Incident {id}",
+        link="",
+        status="Investigating",
+        affected_components=[],
+        latest_message=message,
+        updated_at=datetime(2025, 11, 3, tzinfo=timezone.utc),
+    )
+
+
+class TestCallbackDispatch:
+    def test_async_callback_without_dispatcher(self):
+        fired = []
+
+        async def cb(name, incident):
+            await asyncio.sleep(0)
+            fired.append(incident.id)
+
+        async def scenario():
+            m = StatusPageMonitor(
+                name="Test", feed_url="http://example.com/feed", callback=cb
+            )
+            m._process_entries([_make_entry(id="inc1")], initial=True)
+            assert fired == []  # scheduled, not awaited inline
+            await asyncio.gather(*m._callback_tasks)
+
+        asyncio.run(scenario())
+        assert fired == ["inc1"]
+
+    def test_drop_oldest(self):
+        delivered = []
+
+        async def scenario():
+            d = CallbackDispatcher(maxsize=2, workers=1, policy="drop-oldest")
+            for i in range(4):
+                d.submit(lambda n, inc: delivered.append(inc.id), "P", _incident(str(i)))
+            d.start()
+            await d.close()
+            return d
+
+        d = asyncio.run(scenario())
+        assert delivered == ["2", "3"]
+        assert d.dropped == 2
+
+    def test_queued_event_not_changed_by_later_update(self):
+        delivered = []
+
+        async def scenario():
+            d = CallbackDispatcher(workers=1)
+            m = StatusPageMonitor(
+                name="Test",
+                feed_url="http://example.com/feed",
+                callback=lambda n, inc: delivered.append(inc.status),
+                dispatcher=d,
+            )
+            m._process_entries(
+                [_make_entry(id="inc1", summary="Investigating - looking into it.")],
+                initial=True,
+            )
+            m._process_entries(
+                [
+                    _make_entry(
+                        id="inc1",
+                        summary="Resolved - all good.",
+                        updated=(2025, 11, 3, 15, 0, 0, 0, 307, 0),
+                    )
+                ],
+                initial=False,
+            )
+            d.start()
+            await d.close()
+            return m
+
+        m = asyncio.run(scenario())
+        assert delivered == ["Investigating", "Resolved"]
+        assert m.get_incident("inc1").status == "Resolved"
+
+    def test_coalesce_keeps_latest_per_incident(self):
+        delivered = []
+
+        async def scenario():
+            d = CallbackDispatcher(workers=1, policy="coalesce")
+            cb = lambda n, inc: delivered.append((inc.id, inc.latest_message))
+            d.submit(cb, "P", _incident("a", "first"))
+            d.submit(cb, "P", _incident("b", "only"))
+            d.submit(cb, "P", _incident("a", "second"))
+            d.start()
+            await d.close()
+            return d
+
+        d = asyncio.run(scenario())
+        assert delivered == [("a", "second"), ("b", "only")]
+        assert d.coalesced == 1
+
+    def test_block_applies_backpressure_to_polling(self):
+        release = None
+        order = []
+
+        async def slow(name, incident):
+            order.append(f"deliver {incident.id}")
+            await release.wait()
+
+        async def scenario():
+            nonlocal release
+            release = asyncio.Event()
+            d = CallbackDispatcher(maxsize=1, workers=1, policy="block")
+            d.start()
+            d.submit(slow, "P", _incident("1"))
+            d.submit(slow, "P", _incident("2"))
+            await asyncio.sleep(0)
+
+            waiter = asyncio.create_task(d.wait_for_capacity())
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+
+            release.set()
+            await waiter
+            order.append("room")
+            await d.close()
+
+        asyncio.run(scenario())
+        assert order == ["deliver 1", "deliver 2", "room"]
+
+    def test_unknown_policy_rejected(self):
+        with pytest.raises(ValueError):
+            CallbackDispatcher(policy="random")
+
+
+# ---------------------------------------------------------------------------
+# Tests – Benchmark suite
+# ---------------------------------------------------------------------------
+class TestBenchmarks:
+    def test_suite_smoke_and_baseline_compare(self):
+        from bench_status_tracker import compare, make_feed, run_suite
+
+        assert len(feedparser.parse(make_feed(5)).entries) == 5
+
+        # A bumped feed holds exactly one changed incident
+        m = StatusPageMonitor("Bench", "http://x/feed", lambda n, i: None)
+        m._process_entries(feedparser.parse(make_feed(5)).entries, initial=True)
+        bumped = feedparser.parse(make_feed(5, bump=2)).entries
+        assert m._process_entries(bumped, initial=False) == 1
+
+        results = run_suite(sizes=[10], repeats=1)
+        assert "cycle/10/html" in results
+        assert results["parse_incident/10/plain"]["entries_per_sec"] > 0
+        assert "engine_lean/10/html" in results
+
+        assert compare(results, results) == []
+        faster = {
+            k: {**v, "entries_per_sec": v["entries_per_sec"] * 2}
+            for k, v in results.items()
+        }
+        assert len(compare(results, faster)) == len(results)
+
+
+# ---------------------------------------------------------------------------
+# Tests – Fleet configuration
+# ---------------------------------------------------------------------------
+FLEET_TOML = """
+[defaults]
+interval = 120
+
+[[feeds]]
+name = "OpenAI API"
+url = "https://status.openai.com/history.atom"
+interval = 30
+adaptive = true
+
+[[feeds]]
+name = "GitHub"
+url = "https://www.githubstatus.com/history.atom"
+sinks = ["console", "log"]
+"""
+
+
+class TestFleetConfig:
+    def test_load_toml(self, tmp_path):
+        path = tmp_path / "fleet.toml"
+        path.write_text(FLEET_TOML)
+
+        openai, github = load_fleet_config(str(path))
+        assert (openai.name, openai.poll_interval) == ("OpenAI API", 30)
+        assert openai.options == {"adaptive": True}
+        assert openai.build().adaptive
+        assert github.poll_interval == 120
+        assert github.sinks == ["console", "log"]
+
+    def test_load_json(self, tmp_path):
+        path = tmp_path / "fleet.json"
+        path.write_text(
+            '{"feeds": [{"name": "A", "url": "http://a/feed", "interval": 5}]}'
+        )
+        (config,) = load_fleet_config(str(path))
+        monitor = config.build()
+        assert monitor.poll_interval == 5
+        assert monitor.callback is on_incident_update
+
+    @pytest.mark.parametrize(
+        "feeds",
+        [
+            '[{"name": "A"}]',
+            '[{"name": "A", "url": "u"}, {"name": "A", "url": "v"}]',
+            '[{"name": "A", "url": "u", "sinks": ["pager"]}]',
+            '[{"name": "A", "url": "u", "interval": "60"}]',
+            '[{"name": "A", "url": "u", "min_interval": true}]',
+            '[{"name": "A", "url": "u", "adaptive": "yes"}]',
+            '[{"name": "A", "url": "u", "source": "csv"}]',
+            '[{"name": "A", "url": "u", "parser_engine": "sax"}]',
+        ],
+    )
+    def test_invalid_configs_rejected(self, tmp_path, feeds):
+        path = tmp_path / "fleet.json"
+        path.write_text(f'{{"feeds": {feeds}}}')
+        with pytest.raises(ValueError):
+            load_fleet_config(str(path))
+
+    def test_reload_adds_replaces_and_removes(self, tmp_path):
+        path = tmp_path / "fleet.json"
+        path.write_text(
+            '{"feeds": [{"name": "A", "url": "http://a"},'
+            ' {"name": "B", "url": "http://b"}]}'
+        )
+        fleet = Fleet(str(path))
+        a, b = fleet.load()
+        adopted = []
+        fleet._adopt = adopted.append
+
+        path.write_text(
+            '{"feeds": [{"name": "A", "url": "http://a"},'
+            ' {"name": "B", "url": "http://b", "interval": 10},'
+            ' {"name": "C", "url": "http://c"}]}'
+        )
+        assert fleet.reload() == (2, 1)
+        assert fleet.monitors["A"] is a
+        assert fleet.monitors["B"] is not b and not b._running
+        assert [m.name for m in adopted] == ["B", "C"]
+
+        path.write_text('{"feeds": [{"name": "C", "url": "http://c"}]}')
+        assert fleet.reload() == (0, 2)
+        assert list(fleet.monitors) == ["C"]
+
+    def test_reload_keeps_state_of_same_feed(self, tmp_path):
+        path = tmp_path / "fleet.json"
+        path.write_text('{"feeds": [{"name": "A", "url": "http://a"}]}')
+        fleet = Fleet(str(path))
+        (a,) = fleet.load()
+        fired = []
+        a.callback = lambda n, i: fired.append(i.id)
+        a._polled = True
+        a._etag = '"v1"'
+        a._process_entries([_make_entry(id="inc1")], initial=True)
+
+        path.write_text(
+            '{"feeds": [{"name": "A", "url": "http://a", "interval": 10}]}'
+        )
+        fleet.reload()
+        b = fleet.monitors["A"]
+        assert b is not a and b.poll_interval == 10
+        assert b._polled and b._etag == '"v1"'
+        assert set(b._seen_incidents) == {"inc1"}
+        assert b.get_incident("inc1") is not None
+
+        # Unchanged entries are not reported again by the new monitor
+        b.callback = lambda n, i: fired.append(i.id)
+        fired.clear()
+        b._process_entries([_make_entry(id="inc1")], initial=False)
+        assert fired == []
+
+        # A different URL is a different feed: start from scratch
+        path.write_text('{"feeds": [{"name": "A", "url": "http://other"}]}')
+        fleet.reload()
+        c = fleet.monitors["A"]
+        assert not c._polled and c._seen_incidents == {}
+
+    def test_bad_reload_leaves_fleet_running(self, tmp_path):
+        path = tmp_path / "fleet.json"
+        path.write_text('{"feeds": [{"name": "A", "url": "http://a"}]}')
+        fleet = Fleet(str(path), reload_interval=0.01)
+        (a,) = fleet.load()
+
+        async def scenario():
+            fleet.attach(lambda m: None)
+            for bad in ('"source": "csv"', '"interval": "60"'):
+                path.write_text(
+                    f'{{"feeds": [{{"name": "A", "url": "http://a", {bad}}}]}}'
+                )
+                await asyncio.sleep(0.05)
+                assert fleet.monitors == {"A": a}
+                assert not fleet._watch_task.done()
+
+            # Once the file is fixed, the watcher picks it up
+            path.write_text(
+                '{"feeds": [{"name": "A", "url": "http://a", "interval": 5}]}'
+            )
+            await asyncio.sleep(0.05)
+            fleet.stop()
+
+        asyncio.run(scenario())
+        assert fleet.monitors["A"] is not a
+        assert fleet.monitors["A"].poll_interval == 5
+
+
+# ---------------------------------------------------------------------------
+# Tests – Metrics
+# ---------------------------------------------------------------------------
+class TestMetrics:
+    def test_render_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.describe("x_total", "Things.")
+        registry.inc("x_total", feed='a "b"')
+        registry.inc("x_total", 2, feed='a "b"')
+        registry.observe("lat_seconds", 0.02)
+        registry.gauge("depth", lambda: 3)
+
+        text = registry.render()
+        assert "# HELP x_total Things." in text
+        assert 'x_total{feed="a \\"b\\""} 3' in text
+        assert 'lat_seconds_bucket{le="0.01"} 0' in text
+        assert 'lat_seconds_bucket{le="0.025"} 1' in text
+        assert 'lat_seconds_bucket{le="+Inf"} 1' in text
+        assert "lat_seconds_count 1" in text
+        assert "depth 3" in text
+
+    def test_fetch_counters_and_endpoint(self):
+        async def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.Response(
+                body=SAMPLE_FEED,
+                content_type="application/atom+xml",
+                headers={"ETag": '"v1"'},
+            )
+
+        async def scenario():
+            async with _serve(handler) as server, create_session() as session:
+                m = StatusPageMonitor(
+                    name="Metrics Feed",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: None,
+                )
+                await m.poll(session)
+                await m.poll(session)
+                await m.poll(session)
+
+                runner = await start_metrics_server(port=0)
+                port = runner.addresses[0][1]
+                async with session.get(f"http://127.0.0.1:{port}/metrics") as r:
+                    text = await r.text()
+                await runner.cleanup()
+                return text
+
+        text = asyncio.run(scenario())
+        feed = "Metrics Feed"
+        assert metrics.value("status_tracker_requests_total", feed=feed) == 3
+        assert (
+            metrics.value("status_tracker_responses_total", feed=feed, status="304")
+            == 2
+        )
+        assert metrics.value(
+            "status_tracker_response_bytes_total", feed=feed
+        ) == len(SAMPLE_FEED)
+        assert 'status_tracker_responses_total{feed="Metrics Feed",status="200"} 1' in text
+        assert "status_tracker_fetch_seconds_count" in text
+
+
+# ---------------------------------------------------------------------------
+# Tests – Update coalescing
+# ---------------------------------------------------------------------------
+class TestCoalescing:
+    def _monitor(self, fired, **kwargs):
+        return StatusPageMonitor(
+            name="Test",
+            feed_url="http://example.com/feed",
+            callback=lambda n, i: fired.append((i.id, i.latest_message)),
+            **kwargs,
+        )
+
+    def test_burst_emits_latest_once(self):
+        fired = []
+
+        async def scenario():
+            m = self._monitor(fired, coalesce_window=0.05)
+            m._notify(_incident("a", "first"))
+            await asyncio.sleep(0.01)
+            m._notify(_incident("a", "second"))
+            m._notify(_incident("b", "other"))
+            assert fired == []
+            await asyncio.sleep(0.1)
+
+        asyncio.run(scenario())
+        assert fired == [("a", "second"), ("b", "other")]
+
+    def test_max_delay_bounds_latency(self):
+        fired = []
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            m = self._monitor(fired, coalesce_window=0.04, coalesce_max_delay=0.1)
+            start = loop.time()
+            # Keep updating faster than the window for longer than max delay
+            while loop.time() - start < 0.2 and not fired:
+                m._notify(_incident("a", f"t={loop.time() - start:.2f}"))
+                await asyncio.sleep(0.01)
+            return loop.time() - start
+
+        elapsed = asyncio.run(scenario())
+        assert len(fired) == 1
+        assert elapsed < 0.15
+
+    def test_stop_flushes_held_updates(self):
+        fired = []
+
+        async def scenario():
+            m = self._monitor(fired, coalesce_window=10)
+            m._notify(_incident("a", "held"))
+            m.stop()
+
+        asyncio.run(scenario())
+        assert fired == [("a", "held")]
+
+
+# ---------------------------------------------------------------------------
+# Tests – Retries, Retry-After and circuit breaking
+# ---------------------------------------------------------------------------
+class TestFailureHandling:
+    def _run(self, responses, polls=1, **kwargs):
+        """Poll a local server that answers with ``responses`` in order."""
+        hits = []
+
+        async def handler(request):
+            hits.append(request.path)
+            status, headers = responses.pop(0) if responses else (200, {})
+            if status == 200:
+                return web.Response(
+                    body=SAMPLE_FEED, content_type="application/atom+xml"
+                )
+            return web.Response(status=status, headers=headers)
+
+        fired = []
+
+        async def scenario():
+            async with _serve(handler) as server, create_session() as session:
+                m = StatusPageMonitor(
+                    name="Flaky",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: fired.append(i.id),
+                    breakers={},
+                    **kwargs,
+                )
+                for _ in range(polls):
+                    await m.poll(session)
+                return m
+
+        return asyncio.run(scenario()), hits, fired
+
+    def test_transient_error_is_retried(self, monkeypatch):
+        monkeypatch.setattr("status_tracker.RETRY_BASE_DELAY", 0.001)
+        m, hits, fired = self._run([(502, {}), (500, {})])
+        assert len(hits) == 3
+        assert len(fired) == 3
+
+    def test_retry_after_is_honoured(self, monkeypatch):
+        monkeypatch.setattr("status_tracker.RETRY_BASE_DELAY", 0.001)
+        m, hits, fired = self._run([(503, {"Retry-After": "120"})])
+        assert len(hits) == 1
+        assert m.current_interval == 120
+
+    def test_jitter_never_undercuts_retry_after(self):
+        m = StatusPageMonitor("X", "http://x/feed", lambda n, i: None)
+        m._retry_after = 120
+        scheduler = PollScheduler(session=None, jitter=0.1)
+        delays = [scheduler._next_delay(m) for _ in range(200)]
+        assert min(delays) >= 120
+        assert max(delays) > 120
+
+    def test_breaker_skips_failing_host(self):
+        m, hits, fired = self._run([(500, {})] * 10, polls=7, max_retries=0)
+        # Five failed polls open the circuit; the remaining polls are skipped
+        assert len(hits) == 5
+        assert fired == []
+        text = metrics.render()
+        assert "# HELP status_tracker_circuit_open_total" in text
+        assert "# HELP status_tracker_retries_total" in text
+
+    def test_breaker_half_open_and_backoff(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("status_tracker.time.monotonic", lambda: now[0])
+        b = CircuitBreaker(threshold=2, cooldown=10, max_cooldown=15)
+
+        b.record_failure()
+        assert b.allow()
+        b.record_failure()
+        assert not b.allow()
+
+        now[0] += 10
+        assert b.allow()  # single trial
+        assert not b.allow()
+        b.record_failure()
+        assert b.cooldown == 15
+        assert not b.allow()
+
+        now[0] += 15
+        assert b.allow()
+        b.record_success()
+        assert b.allow() and not b.is_open
+
+    def test_escaping_error_ends_half_open_trial(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("status_tracker.time.monotonic", lambda: now[0])
+        b = CircuitBreaker(threshold=1, cooldown=10)
+        b.record_failure()
+        now[0] += 10
+        m = StatusPageMonitor(
+            "X", "http://x/feed", lambda n, i: None, breakers={"x": b}
+        )
+
+        async def broken_fetch(session, initial):
+            raise RuntimeError("unexpected")
+
+        m._fetch = broken_fetch
+        with pytest.raises(RuntimeError):
+            asyncio.run(m._check_feed(None))
+
+        # The failed trial re-opens the circuit instead of wedging it
+        assert not b.allow()
+        now[0] += 20
+        assert b.allow()
+
+
+# ---------------------------------------------------------------------------
+# Tests – Statuspage JSON source
+# ---------------------------------------------------------------------------
+SAMPLE_JSON = json.dumps(
+    {
+        "page": {"id": "p1", "name": "Example"},
+        "incidents": [
+            {
+                "id": "inc1",
+                "name": "Elevated API errors",
+                "status": "monitoring",
+                "shortlink": "https://stspg.io/inc1",
+                "created_at": "2025-11-03T14:00:00.000Z",
+                "updated_at": "2025-11-03T14:32:00.000Z",
+                "components": [{"name": "API"}, {"name": "Login"}],
+                "incident_updates": [
+                    {"status": "monitoring", "body": "A fix has been deployed."},
+                    {"status": "investigating", "body": "Looking into it."},
+                ],
+            },
+            {
+                "id": "inc0",
+                "name": "Old outage",
+                "status": "postmortem",
+                "shortlink": "https://stspg.io/inc0",
+                "updated_at": "2025-10-01T08:00:00Z",
+                "components": [],
+                "incident_updates": [],
+            },
+        ],
+    }
+)
+
+
+class TestJSONSource:
+    def test_maps_incident_fields(self):
+        scanned = parse_feed_body(SAMPLE_JSON, {}, True, JSON_SOURCE)
+        (iid, key, _, inc), (_, _, _, old) = scanned
+        assert iid == "inc1"
+        assert key == timegm((2025, 11, 3, 14, 32, 0))
+        assert inc.title == "Elevated API errors"
+        assert inc.link == "https://stspg.io/inc1"
+        assert inc.status == "Monitoring"
+        assert inc.affected_components == ["API", "Login"]
+        assert inc.latest_message == "A fix has been deployed."
+        assert inc.updated_at == datetime(2025, 11, 3, 14, 32, tzinfo=timezone.utc)
+        assert old.status == "Resolved"
+        assert old.latest_message == "(no message)"
+
+    def test_unchanged_entries_not_converted(self):
+        incidents = JSON_SOURCE.parse(SAMPLE_JSON)
+        seen = {"inc1": JSON_SOURCE.fingerprint(incidents[0])}
+        scanned = parse_feed_body(SAMPLE_JSON, seen, False, JSON_SOURCE)
+        assert scanned[0][3] is None
+        assert scanned[1][3] is not None
+
+    def test_rejects_non_statuspage_json(self):
+        with pytest.raises(MalformedFeedError):
+            JSON_SOURCE.parse('{"status": "ok"}')
+        with pytest.raises(MalformedFeedError):
+            JSON_SOURCE.parse("<feed/>")
+
+    def test_unknown_source_rejected(self):
+        with pytest.raises(ValueError):
+            StatusPageMonitor("X", "http://x/history.atom", lambda n, i: None, source="csv")
+
+    @pytest.mark.parametrize("has_api, expected", [(True, "json"), (False, "atom")])
+    def test_auto_detects_json_api(self, has_api, expected):
+        hits = []
+
+        async def handler(request):
+            hits.append(request.path)
+            if request.path == "/api/v2/incidents.json":
+                if not has_api:
+                    return web.Response(status=404)
+                return web.Response(text=SAMPLE_JSON, content_type="application/json")
+            return web.Response(body=SAMPLE_FEED, content_type="application/atom+xml")
+
+        fired = []
+
+        async def scenario():
+            async with _serve(handler) as server, create_session() as session:
+                m = StatusPageMonitor(
+                    name="Auto",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: fired.append(i.id),
+                    breakers={},
+                    source="auto",
+                )
+                await m.poll(session)
+                await m.poll(session)
+                return m
+
+        m = asyncio.run(scenario())
+        assert m._source.name == expected
+        if has_api:
+            assert hits == ["/api/v2/incidents.json"] * 3
+            assert fired == ["inc1", "inc0"]
+        else:
+            assert hits == ["/api/v2/incidents.json"] + ["/history.atom"] * 2
+        # Second poll saw nothing new
+        assert len(fired) == len(set(fired))
+
+
+# ---------------------------------------------------------------------------
+# Tests – HTTP/2 transport
+# ---------------------------------------------------------------------------
+class _H2Server:
+    """Minimal h2c server (prior knowledge) that counts TCP connections."""
+
+    def __init__(self, body: bytes, delay: float = 0.05):
+        self.body = body
+        self.delay = delay
+        self.connections = 0
+        self.streams = 0
+        self.max_concurrent = 0
+        self._active = 0
+
+    async def __aenter__(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        self.connections += 1
+        conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        tasks = set()
+
+        async def respond(stream_id):
+            self._active += 1
+            self.max_concurrent = max(self.max_concurrent, self._active)
+            await asyncio.sleep(self.delay)
+            self._active -= 1
+            conn.send_headers(
+                stream_id,
+                [(":status", "200"), ("content-type", "application/atom+xml")],
+            )
+            conn.send_data(stream_id, self.body, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        while data := await reader.read(65536):
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    self.streams += 1
+                    task = asyncio.create_task(respond(event.stream_id))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            writer.write(conn.data_to_send())
+        writer.close()
+
+
+class TestHttp2:
+    def test_multiplexes_feeds_on_one_connection(self):
+        pytest.importorskip("h2")
+        pytest.importorskip("httpx")
+        fired = []
+
+        async def scenario():
+            async with _H2Server(SAMPLE_FEED) as server:
+                async with Http2Session(prior_knowledge=True) as session:
+                    monitors = [
+                        StatusPageMonitor(
+                            name=f"Feed {i}",
+                            feed_url=f"http://127.0.0.1:{server.port}/{i}/history.atom",
+                            callback=lambda n, inc: fired.append((n, inc.id)),
+                            streaming=i % 2 == 1,
+                        )
+                        for i in range(6)
+                    ]
+                    await asyncio.gather(*(m.poll(session) for m in monitors))
+                return server
+
+        server = asyncio.run(scenario())
+        assert server.connections == 1
+        assert server.streams == 6
+        assert server.max_concurrent == 6
+        assert len(fired) == 6 * len(SAMPLE_ENTRIES)
+
+    def test_connection_error_is_transient(self):
+        pytest.importorskip("h2")
+        pytest.importorskip("httpx")
+
+        async def scenario():
+            async with Http2Session(prior_knowledge=True) as session:
+                m = StatusPageMonitor(
+                    name="Down",
+                    feed_url="http://127.0.0.1:9/history.atom",
+                    callback=lambda n, i: None,
+                    max_retries=0,
+                    breakers={},
+                )
+                await m.poll(session)
+                return m
+
+        m = asyncio.run(scenario())
+        assert m.current_incidents() == []
+
+    @pytest.mark.parametrize("http2", [False, True])
+    def test_redirect_loop_is_transient(self, http2):
+        if http2:
+            pytest.importorskip("httpx")
+
+        async def handler(request):
+            raise web.HTTPMovedPermanently(location=str(request.url))
+
+        breakers = {}
+
+        async def scenario():
+            async with _serve(handler) as server, open_session(http2) as session:
+                m = StatusPageMonitor(
+                    name="Loop",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: None,
+                    max_retries=0,
+                    breakers=breakers,
+                )
+                await m.poll(session)
+
+        asyncio.run(scenario())
+        (breaker,) = breakers.values()
+        assert breaker.failures == 1
+
+
+# ---------------------------------------------------------------------------
+# Tests – compressed transfer
+# ---------------------------------------------------------------------------
+def _compress(encoding: str, data: bytes) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(data)
+    if encoding == "deflate":
+        return zlib.compress(data)
+    if encoding == "br":
+        return pytest.importorskip("brotli").compress(data)
+    if encoding == "zstd":
+        return pytest.importorskip("zstandard").ZstdCompressor().compress(data)
+    return data
+
+
+class TestCompressedTransfer:
+    def _poll(self, feed, encoding, body, streaming=False, session_factory=None):
+        accepted = []
+
+        async def handler(request):
+            accepted.append(request.headers.get("Accept-Encoding"))
+            return web.Response(
+                body=body,
+                content_type="application/atom+xml",
+                headers={"Content-Encoding": encoding},
+            )
+
+        fired = []
+
+        async def scenario():
+            factory = session_factory or create_session
+            async with _serve(handler) as server, factory() as session:
+                m = StatusPageMonitor(
+                    name=feed,
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: fired.append(i.id),
+                    streaming=streaming,
+                )
+                await m.poll(session)
+
+        asyncio.run(scenario())
+        return accepted, fired
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate", "br", "zstd"])
+    def test_decodes_and_counts_bytes(self, encoding, streaming):
+        body = _compress(encoding, SAMPLE_FEED)
+        feed = f"Compressed {encoding} {streaming}"
+        accepted, fired = self._poll(feed, encoding, body, streaming)
+
+        assert "gzip" in accepted[0]
+        assert fired == [e[0] for e in SAMPLE_ENTRIES]
+        assert metrics.value("status_tracker_response_bytes_total", feed=feed) == len(
+            body
+        )
+        assert metrics.value("status_tracker_decoded_bytes_total", feed=feed) == len(
+            SAMPLE_FEED
+        )
+
+    def test_corrupt_body_is_malformed(self):
+        feed = "Corrupt gzip"
+        _, fired = self._poll(feed, "gzip", b"definitely not gzip")
+        assert fired == []
+        assert metrics.value("status_tracker_errors_total", feed=feed) == 1
+
+    def test_auto_decompressing_session(self):
+        feed = "Inflated by aiohttp"
+        _, fired = self._poll(
+            feed,
+            "gzip",
+            gzip.compress(SAMPLE_FEED),
+            session_factory=aiohttp.ClientSession,
+        )
+        assert len(fired) == len(SAMPLE_ENTRIES)
+        # Wire size is unknown when aiohttp has already inflated the body
+        assert metrics.value("status_tracker_response_bytes_total", feed=feed) == 0
+        assert metrics.value("status_tracker_decoded_bytes_total", feed=feed) == len(
+            SAMPLE_FEED
+        )
+
+
+# ---------------------------------------------------------------------------
+# Tests – sharded runner
+# ---------------------------------------------------------------------------
+class TestShardedRunner:
+    def test_shard_assignment_is_stable(self):
+        names = [f"Feed {i}" for i in range(200)]
+        shards = [shard_of(name, 4) for name in names]
+        assert shards == [shard_of(name, 4) for name in names]
+        assert set(shards) == {0, 1, 2, 3}
+
+    def test_fleet_runs_only_its_shard(self, tmp_path):
+        path = tmp_path / "fleet.json"
+        feeds = [{"name": f"F{i}", "url": f"http://f{i}/feed"} for i in range(20)]
+        path.write_text(json.dumps({"feeds": feeds}))
+
+        owned = [
+            {m.name for m in Fleet(str(path), shard=(i, 3)).load()} for i in range(3)
+        ]
+        assert set().union(*owned) == {f["name"] for f in feeds}
+        assert sum(len(o) for o in owned) == len(feeds)
+
+    def test_workers_forward_events_to_parent(self, tmp_path):
+        async def handler(request):
+            return web.Response(body=SAMPLE_FEED, content_type="application/atom+xml")
+
+        received = []
+        expected = 4 * len(SAMPLE_ENTRIES)
+
+        async def scenario():
+            async with _serve(handler) as server:
+                path = tmp_path / "fleet.json"
+                feeds = [
+                    {
+                        "name": f"Feed {i}",
+                        "url": str(server.make_url(f"/{i}.atom")),
+                        "interval": 0.5,  # first polls are spread over this
+                    }
+                    for i in range(4)
+                ]
+                path.write_text(json.dumps({"feeds": feeds}))
+
+                def collect(page_name, incident):
+                    received.append((page_name, incident.id))
+                    if len(received) == expected:
+                        runner.stop()
+
+                runner = ShardedRunner(str(path), shards=2, callback=collect)
+                await asyncio.wait_for(runner.run(), timeout=60)
+                return runner
+
+        runner = asyncio.run(scenario())
+        assert runner.delivered == expected
+        order = [e[0] for e in SAMPLE_ENTRIES]
+        for i in range(4):
+            assert [iid for name, iid in received if name == f"Feed {i}"] == order
+
+
+# ---------------------------------------------------------------------------
+# Tests – bytes-first fetch
+# ---------------------------------------------------------------------------
+class TestBytesFetch:
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_declared_encoding_honoured(self, streaming):
+        # Latin-1 body, no charset in Content-Type: only the XML prolog says so
+        body = (
+            _atom_feed([("inc1", "Café outage", "2025-11-03T14:32:00Z", "<p>Down</p>")])
+            .decode()
+            .replace('encoding="UTF-8"', 'encoding="ISO-8859-1"')
+            .encode("latin-1")
+        )
+
+        async def handler(request):
+            return web.Response(body=body, headers={"Content-Type": "application/xml"})
+
+        fired = []
+
+        async def scenario():
+            async with _serve(handler) as server, create_session() as session:
+                m = StatusPageMonitor(
+                    name="Latin-1",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: fired.append(i.title),
+                    streaming=streaming,
+                )
+                await m.poll(session)
+
+        asyncio.run(scenario())
+        assert fired == ["Café outage"]
+
+
+# ---------------------------------------------------------------------------
+# Tests – parser engines
+# ---------------------------------------------------------------------------
+class TestParserEngines:
+    @pytest.mark.parametrize("html", [True, False])
+    def test_engines_produce_same_incidents(self, html):
+        from bench_status_tracker import make_feed
+
+        relative = make_feed(5, html).replace(
+            b'href="https://status.example.com/incidents/', b'href="/incidents/'
+        )
+        with_base = relative.replace(
+            b"<feed ", b'<feed xml:base="https://status.example.com/" ', 1
+        )
+        lowercase = re.sub(
+            rb"<updated>(.*?)T(.*?)Z</updated>", rb"<updated>\1t\2z</updated>", relative
+        )
+        for body in (SAMPLE_FEED, make_feed(50, html), relative, with_base, lowercase):
+            results = {
+                name: [
+                    (iid, key, _fields(inc))
+                    for iid, key, _, inc in parse_feed_body(body, {}, True, source)
+                ]
+                for name, source in PARSER_ENGINES.items()
+            }
+            assert results["lean"] == results["feedparser"]
+
+        lean = parse_feed_body(with_base, {}, True, PARSER_ENGINES["lean"])
+        assert lean[0][3].link == "https://status.example.com/incidents/0"
+        lean = parse_feed_body(lowercase, {}, True, PARSER_ENGINES["lean"])
+        assert all(key for _, key, _, _ in lean)
+
+    def test_lean_engine_rejects_non_atom(self):
+        lean = PARSER_ENGINES["lean"]
+        with pytest.raises(MalformedFeedError):
+            lean.parse(b"<rss version='2.0'><channel/></rss>")
+        with pytest.raises(MalformedFeedError):
+            lean.parse(b"<feed")
+
+    def test_monitor_with_lean_engine(self):
+        async def handler(request):
+            return web.Response(body=SAMPLE_FEED, content_type="application/atom+xml")
+
+        fired = []
+
+        async def scenario():
+            async with _serve(handler) as server, create_session() as session:
+                m = StatusPageMonitor(
+                    name="Lean",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: fired.append(i.id),
+                    parser_engine="lean",
+                )
+                await m.poll(session)
+
+        asyncio.run(scenario())
+        assert fired == [e[0] for e in SAMPLE_ENTRIES]
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError):
+            StatusPageMonitor(
+                "X", "http://x/history.atom", lambda n, i: None, parser_engine="sax"
+            )
+
+
+# ---------------------------------------------------------------------------
+# Tests – unchanged body short-circuit
+# ---------------------------------------------------------------------------
+class TestBodyHash:
+    def test_identical_body_skips_parse(self):
+        new = ("inc4", "New", "2025-11-04T09:00:00Z", "<p>Investigating</p>")
+        bodies = [SAMPLE_FEED] * 3 + [_atom_feed([new] + SAMPLE_ENTRIES)]
+        parsed = []
+        fired = []
+
+        async def handler(request):
+            # Rotating ETag that never produces a 304
+            return web.Response(
+                body=bodies.pop(0),
+                content_type="application/atom+xml",
+                headers={"ETag": f'"{len(bodies)}"'},
+            )
+
+        async def scenario():
+            async with _serve(handler) as server, create_session() as session:
+                m = StatusPageMonitor(
+                    name="No validators",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: fired.append(i.id),
+                )
+                parse = m._parse_body
+
+                async def spy(body, initial):
+                    parsed.append(initial)
+                    return await parse(body, initial)
+
+                m._parse_body = spy
+                for _ in range(4):
+                    await m.poll(session)
+
+        asyncio.run(scenario())
+        assert parsed == [True, False]
+        assert fired == ["inc3", "inc2", "inc1", "inc4"]
+        assert (
+            metrics.value("status_tracker_body_unchanged_total", feed="No validators")
+            == 2
+        )
+
+    def test_failed_processing_does_not_mark_body_seen(self):
+        async def handler(request):
+            return web.Response(body=SAMPLE_FEED, content_type="application/atom+xml")
+
+        broken = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        broken.shutdown()
+        fired = []
+
+        async def scenario():
+            async with _serve(handler) as server, create_session() as session:
+                m = StatusPageMonitor(
+                    name="Broken executor",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: fired.append(i.id),
+                    parse_executor=broken,
+                )
+                with pytest.raises(RuntimeError):
+                    await m.poll(session)
+                m._parse_executor = None
+                await m.poll(session)
+                await m.poll(session)
+                return m
+
+        m = asyncio.run(scenario())
+        assert fired == [e[0] for e in SAMPLE_ENTRIES]
+        assert set(m._seen_incidents) == {e[0] for e in SAMPLE_ENTRIES}
+
+
+# ---------------------------------------------------------------------------
+# Tests – HTTP caching
+# ---------------------------------------------------------------------------
+class TestHttpCaching:
+    @pytest.mark.parametrize(
+        "headers, expected",
+        [
+            ({}, None),
+            ({"Cache-Control": "public, max-age=300"}, 300),
+            ({"Cache-Control": "max-age=300", "Age": "100"}, 200),
+            ({"Cache-Control": "max-age=60, no-cache"}, 0),
+            ({"Cache-Control": "no-store"}, 0),
+            (
+                {
+                    "Date": "Mon, 03 Nov 2025 14:00:00 GMT",
+                    "Expires": "Mon, 03 Nov 2025 14:02:00 GMT",
+                },
+                120,
+            ),
+            ({"Expires": "0"}, 0),
+        ],
+    )
+    def test_freshness_lifetime(self, headers, expected):
+        assert _freshness_lifetime(headers) == expected
+
+    def _run(self, routes, polls=3, **kwargs):
+        hits = []
+
+        async def handler(request):
+            hits.append(request.path)
+            return routes[request.path]()
+
+        async def scenario():
+            async with _serve(handler) as server, create_session() as session:
+                m = StatusPageMonitor(
+                    name="Cached",
+                    feed_url=str(server.make_url("/history.atom")),
+                    callback=lambda n, i: None,
+                    breakers={},
+                    **kwargs,
+                )
+                for _ in range(polls):
+                    await m.poll(session)
+                return m
+
+        return asyncio.run(scenario()), hits
+
+    def _feed(self, **headers):
+        return lambda: web.Response(
+            body=SAMPLE_FEED, content_type="application/atom+xml", headers=headers
+        )
+
+    def test_fresh_response_skips_requests(self):
+        before = metrics.value("status_tracker_cache_fresh_total", feed="Cached")
+        m, hits = self._run(
+            {"/history.atom": self._feed(**{"Cache-Control": "max-age=300"})}
+        )
+        assert hits == ["/history.atom"]
+        assert metrics.value("status_tracker_cache_fresh_total", feed="Cached") == (
+            before + 2
+        )
+        assert 290 < m.current_interval <= 300
+
+        # Freshness is capped per feed...
+        m, hits = self._run(
+            {"/history.atom": self._feed(**{"Cache-Control": "max-age=300"})},
+            max_freshness=120,
+        )
+        assert 110 < m.fresh_for <= 120
+
+        # ...and can be ignored entirely
+        m, hits = self._run(
+            {"/history.atom": self._feed(**{"Cache-Control": "max-age=300"})},
+            max_freshness=0,
+        )
+        assert len(hits) == 3
+        assert m.current_interval == m.poll_interval
+
+    @pytest.mark.parametrize(
+        "status, expected",
+        [
+            (301, ["/history.atom", "/new.atom", "/new.atom", "/new.atom"]),
+            (308, ["/history.atom", "/new.atom", "/new.atom", "/new.atom"]),
+            (302, ["/history.atom", "/new.atom"] * 3),
+        ],
+    )
+    def test_permanent_redirects_are_cached(self, status, expected):
+        def redirect():
+            return web.Response(status=status, headers={"Location": "/new.atom"})
+
+        m, hits = self._run(
+            {"/history.atom": redirect, "/new.atom": self._feed()}, polls=3
+        )
+        assert hits == expected
+        # State stays keyed by the configured URL
+        assert m.feed_url.endswith("/history.atom")